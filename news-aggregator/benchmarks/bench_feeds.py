@@ -0,0 +1,100 @@
+# benchmarks/bench_feeds.py
+"""Compare bytes read and CPU time per source of RSS/Atom feeds against HTML scraping.
+
+Runs on fixtures recorded with scraper.replay, which keeps both the feed and
+the section page of every source that declares a feed in sources.json:
+    python -m scraper.replay record benchmarks/fixtures --platform NPR
+    python benchmarks/bench_feeds.py benchmarks/fixtures
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("NEWS_AGGREGATOR_CACHE", tempfile.mkdtemp(prefix="news-bench-"))
+
+from fetcher import PLATFORM_TOPIC_MAP
+from scraper import client
+from scraper.feeds import CHUNK_SIZE, parse_feed
+from scraper.parsing import extract_links
+from scraper.replay import ReplayServer, load_index, to_replay
+
+
+def measured(func, runs):
+    """Median CPU ms of the calling thread (the replay server runs in its
+    own threads and is not counted) and the last ``(bytes, stories)``."""
+    samples = []
+    for _ in range(runs):
+        start = time.thread_time()
+        result = func()
+        samples.append(time.thread_time() - start)
+    return statistics.median(samples) * 1000, result
+
+
+def html_source(session, server, spec):
+    res = session.get(to_replay(server.url, spec.url), timeout=client.DEFAULT_TIMEOUT)
+    res.raise_for_status()
+    return len(res.content), extract_links(res.text, spec.selector, spec.source, spec.base, spec.max_count)
+
+
+def feed_source(session, server, spec):
+    received = 0
+
+    def chunks(res):
+        nonlocal received
+        for chunk in res.iter_content(CHUNK_SIZE):
+            received += len(chunk)
+            yield chunk
+
+    with session.get(to_replay(server.url, spec.feed), timeout=client.DEFAULT_TIMEOUT, stream=True) as res:
+        res.raise_for_status()
+        stories = parse_feed(chunks(res), spec.feed, spec.source, spec.max_count)
+    return received, stories
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixtures", nargs="?", default=str(Path(__file__).resolve().parent / "fixtures"))
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--source", action="append", help="only these sources, e.g. NPR/World")
+    args = parser.parse_args()
+
+    index = load_index(args.fixtures)
+    server = ReplayServer(args.fixtures).start()
+    session = client._new_session()
+    print(f"Fixtures recorded {index['recorded_at']}, {args.runs} runs, median CPU times\n")
+    print(f"{'source':<16} {'html KB':>8} {'cpu ms':>7} {'n':>3}   {'feed KB':>8} {'cpu ms':>7} {'n':>3}")
+
+    totals = [0, 0.0, 0, 0.0]
+    try:
+        for platform, topics in PLATFORM_TOPIC_MAP.items():
+            for topic, spec in topics.items():
+                name = f"{platform}/{topic}"
+                if not spec.feed or (args.source and name not in args.source):
+                    continue
+                if spec.feed not in index["pages"] or spec.url not in index["pages"]:
+                    print(f"{name:<16} not recorded")
+                    continue
+                try:
+                    html_ms, (html_bytes, html_stories) = measured(lambda: html_source(session, server, spec), args.runs)
+                    feed_ms, (feed_bytes, feed_stories) = measured(lambda: feed_source(session, server, spec), args.runs)
+                except Exception as e:
+                    print(f"{name:<16} {e}")
+                    continue
+                totals = [a + b for a, b in zip(totals, (html_bytes, html_ms, feed_bytes, feed_ms))]
+                print(f"{name:<16} {html_bytes / 1024:8.1f} {html_ms:7.2f} {len(html_stories):>3}   "
+                      f"{feed_bytes / 1024:8.1f} {feed_ms:7.2f} {len(feed_stories):>3}")
+    finally:
+        server.shutdown()
+
+    if totals[1]:
+        print(f"\nTotal: html {totals[0] / 1024:.1f} KB {totals[1]:.1f} ms, "
+              f"feed {totals[2] / 1024:.1f} KB {totals[3]:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
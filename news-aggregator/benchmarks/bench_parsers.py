@@ -0,0 +1,98 @@
+# benchmarks/bench_parsers.py
+"""Compare the original html.parser + select() extraction with each parser backend.
+
+Usage:
+    python benchmarks/bench_parsers.py --source CNN/World saved_page.html [...]
+    python benchmarks/bench_parsers.py --source NPR/World https://www.npr.org/sections/world/
+    python benchmarks/bench_parsers.py --source CNN/World --synthetic 2000
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+
+from scraper.parsing import BACKENDS, extract_links
+from scraper.registry import REGISTRY
+
+# The selector, source and base of each HTML source in sources.json.
+SOURCES = {f"{platform}/{topic}": spec for (platform, topic), spec in REGISTRY.sources.items() if spec.kind == "html"}
+
+
+def baseline_extract(html, selector, source, base, max_count=10):
+    # The pre-backend implementation: full html.parser soup, eager select().
+    soup = BeautifulSoup(html, "html.parser")
+    stories = []
+    for item in soup.select(selector):
+        title = item.get_text(strip=True)
+        if not title:
+            continue
+        parent = item if item.name == "a" else item.find_parent("a")
+        if parent:
+            href = parent.get("href", "")
+            link = base + href if href.startswith("/") else href
+            if link not in [s[2] for s in stories]:
+                stories.append((source, title, link))
+        if len(stories) >= max_count:
+            break
+    return stories
+
+
+def synthetic_page(blocks):
+    cards = "".join(
+        f'<div class="card"><a href="/2025/story-{i}"><h3><span>Headline number {i}</span></h3></a>'
+        f'<p>{"Filler text. " * 20}</p></div>'
+        for i in range(blocks)
+    )
+    return f"<html><head><title>t</title></head><body><article><h2><a href='/top'>Top</a></h2></article>{cards}</body></html>"
+
+
+def load(source):
+    if source.startswith(("http://", "https://")):
+        from scraper import client
+        return client.get(source).text
+    return Path(source).read_text(encoding="utf-8", errors="replace")
+
+
+def timed(func, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", help="saved HTML files or URLs")
+    parser.add_argument("--source", choices=sorted(SOURCES), default="CNN/World", metavar="PLATFORM/TOPIC")
+    parser.add_argument("--synthetic", type=int, metavar="BLOCKS", help="benchmark a generated page")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-count", type=int, default=10)
+    args = parser.parse_args()
+
+    spec = SOURCES[args.source]
+    selector, source, base = spec.selector, spec.source, spec.base
+    pages = [(p, load(p)) for p in args.pages]
+    if args.synthetic:
+        pages.append((f"synthetic-{args.synthetic}", synthetic_page(args.synthetic)))
+    if not pages:
+        parser.error("give at least one page or --synthetic")
+
+    for name, html in pages:
+        print(f"{name} ({len(html.encode('utf-8')) / 1024:.0f} KB)")
+        base_ms, expected = timed(lambda: baseline_extract(html, selector, source, base, args.max_count), args.runs)
+        print(f"  {'baseline':<12} {base_ms:8.2f} ms  {len(expected)} stories")
+        for backend in BACKENDS:
+            ms, stories = timed(lambda: extract_links(html, selector, source, base, args.max_count, backend), args.runs)
+            same = "same" if stories == expected else "differs"
+            print(f"  {backend:<12} {ms:8.2f} ms  {len(stories)} stories ({same}, {base_ms / ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
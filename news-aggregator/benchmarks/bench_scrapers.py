@@ -0,0 +1,101 @@
+# benchmarks/bench_scrapers.py
+"""Fetch and parse benchmark for every scraper, replayed from recorded fixtures.
+
+Record the fixtures once (this is the only step that needs the network):
+    python -m scraper.replay record benchmarks/fixtures
+
+Then, fully offline:
+    python benchmarks/bench_scrapers.py benchmarks/fixtures
+    python benchmarks/bench_scrapers.py benchmarks/fixtures --backend lxml --backend selectolax --latency 40
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("NEWS_AGGREGATOR_CACHE", tempfile.mkdtemp(prefix="news-bench-"))
+
+from scraper import client
+from scraper.feeds import parse_feed
+from scraper.parsing import BACKENDS, HAVE_LXML, extract_links
+from scraper.registry import REGISTRY
+from scraper.replay import ReplayServer, load_index, to_replay
+from scraper.tldr_utils import parse_issue
+
+TLDR_BACKENDS = ["html.parser", "lxml"] if HAVE_LXML else ["html.parser"]
+# Recordings of sources with a feed hold the feed too; it is parsed as XML.
+FEEDS = {spec.feed for spec in REGISTRY.sources.values() if spec.feed}
+
+
+def timed(func, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000, result
+
+
+def parsers(spec, backends, url=None):
+    """Return ``{backend: parse(html)}`` for the pages of the source ``spec``."""
+    if url in FEEDS:
+        return {"feed": lambda xml: parse_feed([xml], url, spec.source, spec.max_count)}
+    if spec.kind == "tldr":
+        return {b: (lambda html, b=b: parse_issue(html, spec.source, b)) for b in TLDR_BACKENDS if not backends or b in backends}
+    return {
+        b: (lambda html, b=b: extract_links(html, spec.selector, spec.source, spec.base, spec.max_count, b))
+        for b in BACKENDS if not backends or b in backends
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixtures", nargs="?", default=str(Path(__file__).resolve().parent / "fixtures"))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--backend", action="append", help="parser backend to time (default: all available)")
+    parser.add_argument("--source", action="append", help="only these sources, e.g. CNN/World")
+    parser.add_argument("--latency", type=float, default=0, metavar="MS", help="delay added by the replay server")
+    args = parser.parse_args()
+
+    index = load_index(args.fixtures)
+    server = ReplayServer(args.fixtures, latency=args.latency / 1000).start()
+    # A plain session: the per-host rate limiter would otherwise dominate
+    # the fetch timings of repeated runs.
+    session = client._new_session()
+    print(f"Fixtures recorded {index['recorded_at']}, {args.runs} runs, median times\n")
+    print(f"{'source':<16} {'status':>6} {'KB':>7} {'fetch ms':>9}  parse ms (stories) per backend")
+
+    totals = {}
+    try:
+        for name, urls in sorted(index["sources"].items()):
+            if args.source and name not in args.source:
+                continue
+            spec = REGISTRY.sources.get(tuple(name.split("/", 1)))
+            if spec is None:
+                print(f"{name:<16} not in sources.json")
+                continue
+            for url in dict.fromkeys(urls):
+                fetch_ms, res = timed(lambda: session.get(to_replay(server.url, url), timeout=client.DEFAULT_TIMEOUT), args.runs)
+                columns = []
+                if res.ok and res.history == []:
+                    html = res.content if url in FEEDS else res.text
+                    for backend, parse in parsers(spec, args.backend, url).items():
+                        ms, stories = timed(lambda: parse(html), args.runs)
+                        totals[backend] = totals.get(backend, 0.0) + ms
+                        columns.append(f"{backend} {ms:7.2f} ({len(stories)})")
+                elif res.history:
+                    columns.append("redirected (no issue)")
+                print(f"{name:<16} {res.status_code:>6} {len(res.content) / 1024:7.1f} {fetch_ms:9.2f}  " + "  ".join(columns))
+    finally:
+        server.shutdown()
+
+    if totals:
+        print("\nTotal parse time: " + ", ".join(f"{b} {ms:.1f} ms" for b, ms in totals.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import hashlib
+import re
+import struct
+import threading
+from functools import lru_cache
+
+NUM_PERM = 64
+BANDS = 16             # 16 bands of 4 rows: pairs above ~0.5 Jaccard collide
+ROWS = NUM_PERM // BANDS
+SIMILARITY = 0.5       # estimated Jaccard needed to join a cluster
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or says "
+    "that the to was were what will with after over new".split()
+)
+
+_UNPACK = struct.Struct(f">{NUM_PERM}I").unpack
+
+
+def title_tokens(title):
+    return {w for w in re.findall(r"[a-z0-9]+", title.lower()) if w not in STOPWORDS}
+
+
+@lru_cache(maxsize=65536)
+def _token_hashes(token):
+    # One SHAKE digest yields NUM_PERM independent 32-bit hashes of the token.
+    return _UNPACK(hashlib.shake_128(token.encode("utf-8")).digest(4 * NUM_PERM))
+
+
+def minhash(tokens):
+    if not tokens:
+        return None
+    return tuple(map(min, zip(*(_token_hashes(t) for t in tokens))))
+
+
+def similarity(sig_a, sig_b):
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / NUM_PERM
+
+
+class TitleClusterer:
+    """Incremental near-duplicate clustering of headlines with MinHash + LSH.
+
+    Each title's MinHash signature is split into bands; only titles sharing
+    a band bucket are compared, so adding a title costs roughly the size of
+    its buckets rather than the whole corpus.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._signatures = {}
+        self._cluster_of = {}
+        self._next_cluster = 0
+
+    def add(self, key, title):
+        """Index ``key`` under ``title`` and return the id of its cluster."""
+        with self._lock:
+            if key in self._cluster_of:
+                return self._cluster_of[key]
+            signature = minhash(title_tokens(title))
+            if signature is None:
+                return self._new_cluster(key)
+
+            bands = [(i, signature[i * ROWS:(i + 1) * ROWS]) for i in range(BANDS)]
+            candidates = set()
+            for band in bands:
+                candidates.update(self._buckets.get(band, ()))
+
+            best, best_score = None, SIMILARITY
+            for candidate in candidates:
+                score = similarity(signature, self._signatures[candidate])
+                if score >= best_score:
+                    best, best_score = candidate, score
+
+            for band in bands:
+                self._buckets.setdefault(band, []).append(key)
+            self._signatures[key] = signature
+            if best is None:
+                return self._new_cluster(key)
+            self._cluster_of[key] = self._cluster_of[best]
+            return self._cluster_of[key]
+
+    def _new_cluster(self, key):
+        self._cluster_of[key] = self._next_cluster
+        self._next_cluster += 1
+        return self._cluster_of[key]
+
+    def cluster_of(self, key):
+        with self._lock:
+            return self._cluster_of.get(key)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._cluster_of)
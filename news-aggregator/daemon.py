@@ -0,0 +1,176 @@
+"""Headless news service: refreshes every source on a schedule and serves
+the results from an in-memory TTL cache over a local HTTP/JSON API.
+
+    python daemon.py [--host 127.0.0.1] [--port 8765] [--interval 1800]
+
+Endpoints:
+    GET /stories?platform=CNN&topic=World   stories, filterable by repeated
+                                            platform/topic parameters
+    GET /stories/new?since=T                stories first seen after unix
+                                            time T, from the story store
+    GET /sources                            every (platform, topic) with the
+                                            time its stories were fetched
+    GET /metrics                            per-source timings and parse memo
+                                            hits/misses in the Prometheus
+                                            text format
+    GET /metrics.jsonl                      the same, one JSON object per
+                                            source and line, then a
+                                            {"parse_memo": ...} line
+    GET /health                             includes the fetches of the last
+                                            refresh shared with an identical
+                                            in-flight request
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from fetcher import PLATFORM_TOPIC_MAP, fetch_news_report
+from scraper.memo import parse_memo
+from scraper.metrics import source_metrics
+from store import StoryStore
+from ttl_cache import TTLCache
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_INTERVAL = 30 * 60
+
+
+class NewsService:
+    def __init__(self, interval=DEFAULT_INTERVAL, store=None):
+        self.interval = interval
+        self.store = store
+        # Entries outlive one missed refresh so a slow or failing source keeps
+        # serving its last stories instead of disappearing.
+        self.cache = TTLCache(ttl=2 * interval)
+        self.last_refresh = None
+        self.last_deduplicated = 0
+
+    def refresh(self):
+        results = {}
+
+        def on_result(platform, topic, stories):
+            # Each source is served as soon as it lands; the store gets one
+            # bulk upsert (one transaction) per refresh.
+            self.cache.set((platform, topic), stories)
+            results[(platform, topic)] = stories
+
+        report = fetch_news_report(None, None, on_result=on_result)
+        if self.store is not None and results:
+            self.store.upsert(results)
+        self.cache.purge()
+        self.last_refresh = time.time()
+        self.last_deduplicated = report.deduplicated
+        for platform, topic in report.timed_out:
+            print(f"Timed out fetching {platform} {topic}")
+        return report
+
+    def run_scheduler(self, stop):
+        while not stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Error refreshing news: {e}")
+            stop.wait(self.interval)
+
+    def stories(self, platforms=None, topics=None):
+        items = []
+        for platform, topic_map in PLATFORM_TOPIC_MAP.items():
+            if platforms and platform not in platforms:
+                continue
+            for topic in topic_map:
+                if topics and topic not in topics:
+                    continue
+                for source, title, link in self.cache.get((platform, topic), []):
+                    items.append({"platform": platform, "topic": topic, "source": source, "title": title, "link": link})
+        return items
+
+    def sources(self):
+        items = []
+        for platform, topic_map in PLATFORM_TOPIC_MAP.items():
+            for topic in topic_map:
+                entry = self.cache.get_entry((platform, topic))
+                items.append({"platform": platform, "topic": topic, "fetched_at": entry[0] if entry else None})
+        return items
+
+
+class NewsRequestHandler(BaseHTTPRequestHandler):
+    service = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path == "/stories":
+            body = {
+                "updated": self.service.last_refresh,
+                "stories": self.service.stories(query.get("platform"), query.get("topic")),
+            }
+        elif url.path == "/stories/new" and self.service.store is not None:
+            try:
+                since = float(query.get("since", ["0"])[0])
+            except ValueError:
+                self.send_error(400, "since must be a unix timestamp")
+                return
+            body = {"since": since, "stories": self.service.store.new_since(since, query.get("platform"), query.get("topic"))}
+        elif url.path == "/sources":
+            body = {"updated": self.service.last_refresh, "sources": self.service.sources()}
+        elif url.path == "/health":
+            body = {"ok": True, "updated": self.service.last_refresh, "deduplicated": self.service.last_deduplicated}
+        elif url.path == "/metrics":
+            self._send_text(source_metrics.prometheus() + parse_memo.prometheus(), "text/plain; version=0.0.4")
+            return
+        elif url.path == "/metrics.jsonl":
+            memo = json.dumps({"parse_memo": parse_memo.stats()}) + "\n"
+            self._send_text(source_metrics.jsonl() + memo, "application/x-ndjson")
+            return
+        else:
+            self.send_error(404)
+            return
+        self._send_json(body)
+
+    def _send_json(self, body):
+        self._send_text(json.dumps(body), "application/json")
+
+    def _send_text(self, text, content_type):
+        data = text.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    handler = type("BoundNewsRequestHandler", (NewsRequestHandler,), {"service": service})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless news aggregator service")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--interval", type=int, default=DEFAULT_INTERVAL, help="seconds between refreshes")
+    args = parser.parse_args()
+
+    service = NewsService(args.interval, StoryStore())
+    stop = threading.Event()
+    threading.Thread(target=service.run_scheduler, args=(stop,), daemon=True).start()
+
+    server = serve(service, args.host, args.port)
+    print(f"Serving news on http://{args.host}:{args.port}/stories")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import partial
+
+from scraper.cache import flush_all
+from scraper.metrics import SourceMetrics, collect, source_metrics
+from scraper.registry import REGISTRY, host_of, scrape, scrape_feed, scrape_page
+
+# {platform: {topic: SourceSpec}}, declared in sources.json. Nothing is
+# imported to scrape a source until it is first fetched, so starting the app
+# does not load bs4 and requests.
+PLATFORM_TOPIC_MAP = REGISTRY.by_platform()
+
+MAX_WORKERS = 16
+PER_HOST_LIMIT = 3
+REFRESH_DEADLINE = 20  # seconds for a whole refresh
+CANCEL_POLL = 0.25     # seconds between checks of the cancel event
+
+# Concurrency is capped per URL host rather than per platform, since one
+# registry platform may span several hosts and several platforms one host.
+_host_limits = {}
+_host_limits_lock = threading.Lock()
+
+# ``deduplicated`` counts the fetches of this refresh that joined an identical
+# in-flight request (including ones started by an overlapping refresh).
+FetchReport = namedtuple("FetchReport", ["stories", "timed_out", "failed", "deduplicated"])
+
+
+def load_scraper(platform, topic):
+    """Return a callable that scrapes ``(platform, topic)``."""
+    return partial(scrape, PLATFORM_TOPIC_MAP[platform][topic])
+
+
+def _host_limit(host):
+    with _host_limits_lock:
+        limit = _host_limits.get(host)
+        if limit is None:
+            limit = _host_limits[host] = threading.BoundedSemaphore(PER_HOST_LIMIT)
+        return limit
+
+
+def _resolve(platforms, topics, pairs=None):
+    if pairs is not None:
+        return [(platform, topic) for platform, topic in pairs if topic in PLATFORM_TOPIC_MAP.get(platform, {})]
+
+    all_platforms = list(PLATFORM_TOPIC_MAP.keys())
+    all_topics = sorted({topic for pt_map in PLATFORM_TOPIC_MAP.values() for topic in pt_map})
+
+    if not platforms:
+        platforms = all_platforms
+    if not topics:
+        topics = all_topics
+
+    return [(platform, topic) for platform in platforms for topic in topics
+            if topic in PLATFORM_TOPIC_MAP.get(platform, {})]
+
+
+def _plan(jobs):
+    """Group jobs into units of work, each returning ``{(platform, topic): stories}``.
+
+    A unit is ``(host, keys, func, fallback)``: ``func`` only contacts
+    ``host``, and ``fallback`` (a unit or None) is queued in its place when
+    it returns no stories. A unit may also return no entry for a key when
+    other units still have to finish it.
+    """
+    units = []
+    for platform, topic in jobs:
+        spec = PLATFORM_TOPIC_MAP[platform][topic]
+        key = (platform, topic)
+        if spec.kind == "tldr":
+            # Every uncached (category, date) is its own probe unit, so all
+            # TLDR dates go out in one concurrent pass under the tldr.tech
+            # limit, the deadline and cancel. A fully cached category falls
+            # through to the page unit, which makes no request.
+            from scraper.tldr_utils import IssueProbe
+            issue = IssueProbe(spec.category, spec.source)
+            if issue.pending:
+                units += [(host_of(spec.url), [key], lambda issue=issue, date=date, key=key: _probe_issue(issue, date, key), None)
+                          for date in issue.pending]
+                continue
+        page = (host_of(spec.url), [key], lambda spec=spec, key=key: {key: scrape_page(spec)}, None)
+        if spec.feed:
+            # The page is fetched, under its own host's limit, only if the
+            # feed yields nothing.
+            units.append((host_of(spec.feed), [key], lambda spec=spec, key=key: {key: scrape_feed(spec)}, page))
+        else:
+            units.append(page)
+    return units
+
+
+def _probe_issue(issue, date, key):
+    # The probe that completes the issue reports the whole category.
+    return {key: issue.result()} if issue.probe(date) else {}
+
+
+def _run(func, unit_metrics):
+    with collect(unit_metrics):
+        start = time.perf_counter()
+        try:
+            return func()
+        finally:
+            unit_metrics.duration = time.perf_counter() - start
+
+
+def _iter_units(jobs, deadline, cancel, failed, timed_out, recorded=None):
+    """Yield ``(platform, topic, stories)`` as units finish, filling ``failed``
+    and ``timed_out`` with the keys that did not (and ``recorded`` with the
+    metrics of every unit).
+
+    Units wait in a queue and are only handed to the pool once their host
+    has a free slot, so a busy host never ties up worker threads that other
+    hosts could use.
+    """
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    queued = deque(_plan(jobs))
+    futures = {}
+    unit_metrics = {}
+    pending = set()
+
+    def dispatch():
+        for _ in range(len(queued)):
+            if len(pending) >= MAX_WORKERS:
+                return
+            unit = queued.popleft()
+            host, keys, func, _ = unit
+            limit = _host_limit(host)
+            if not limit.acquire(blocking=False):
+                queued.append(unit)
+                continue
+            metrics = SourceMetrics(keys[0][0], ", ".join(topic for _, topic in keys))
+            if recorded is not None:
+                recorded.append(metrics)
+            future = executor.submit(_run, func, metrics)
+            future.add_done_callback(lambda _, limit=limit: limit.release())
+            futures[future] = unit
+            unit_metrics[future] = metrics
+            pending.add(future)
+
+    stop_at = time.monotonic() + deadline
+    abandoned = True
+    try:
+        dispatch()
+        while (pending or queued) and not (cancel and cancel.is_set()):
+            remaining = stop_at - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=min(remaining, CANCEL_POLL), return_when=FIRST_COMPLETED)
+            dispatch()
+            for future in done:
+                # Dropped as they are consumed so a refresh of hundreds of
+                # sources does not hold every result until it ends.
+                _, keys, _, fallback = futures.pop(future)
+                metrics = unit_metrics.pop(future)
+                try:
+                    unit_results = future.result()
+                except Exception as e:
+                    for platform, topic in keys:
+                        print(f"Error fetching {platform} {topic}: {e}")
+                    failed.extend(keys)
+                    metrics.error = str(e)
+                    source_metrics.record(metrics)
+                    continue
+                metrics.stories = sum(len(unit_results.get(key, ())) for key in keys)
+                source_metrics.record(metrics)
+                if fallback is not None and not metrics.stories:
+                    queued.append(fallback)
+                    dispatch()
+                    continue
+                for platform, topic in keys:
+                    if (platform, topic) in unit_results:
+                        yield platform, topic, unit_results[(platform, topic)]
+        abandoned = cancel is not None and cancel.is_set()
+    finally:
+        # Also reached when the consumer closes the generator early.
+        executor.shutdown(wait=False, cancel_futures=True)
+        # Cache indexes are written once per refresh rather than per response.
+        flush_all()
+        # A TLDR category with several probes left is listed once.
+        unfinished = [key for future in futures if future in pending for key in futures[future][1]]
+        unfinished += [key for unit in queued for key in unit[1]]
+        timed_out.extend(dict.fromkeys(unfinished))
+        if not abandoned:
+            for future in pending:
+                unit_metrics[future].error = "timed out"
+                unit_metrics[future].duration = time.time() - unit_metrics[future].started_at
+                source_metrics.record(unit_metrics[future])
+
+
+def iter_news(platforms, topics, deadline=REFRESH_DEADLINE, cancel=None, pairs=None):
+    """Yield ``(platform, topic, stories)`` for each source as soon as it completes.
+
+    Sources are fetched concurrently as in ``fetch_news``; the fastest come
+    out first. Setting ``cancel``, passing the deadline or closing the
+    generator stops waiting for the sources still running.
+    """
+    yield from _iter_units(_resolve(platforms, topics, pairs), deadline, cancel, [], [])
+
+
+def fetch_news_report(platforms, topics, deadline=REFRESH_DEADLINE, on_result=None, cancel=None, pairs=None):
+    """Fetch every selected (platform, topic) concurrently within one deadline.
+
+    Sources that have not finished when the deadline passes (or when the
+    ``cancel`` event is set) are reported in ``timed_out`` and their stories
+    are left out; everything that did finish is returned in the usual
+    platform/topic order. ``on_result(platform, topic, stories)`` is called
+    from the calling thread as each source completes. ``pairs`` restricts the
+    refresh to explicit ``(platform, topic)`` pairs instead of every
+    combination of ``platforms`` and ``topics``.
+    """
+    jobs = _resolve(platforms, topics, pairs)
+    results = {}
+    failed = []
+    timed_out = []
+    recorded = []
+    for platform, topic, stories in _iter_units(jobs, deadline, cancel, failed, timed_out, recorded):
+        results[(platform, topic)] = stories
+        if on_result:
+            on_result(platform, topic, stories)
+
+    stories = []
+    for key in jobs:
+        stories += results.get(key, [])
+    return FetchReport(stories, timed_out, failed, sum(metrics.deduplicated for metrics in recorded))
+
+
+def fetch_news(platforms, topics, deadline=REFRESH_DEADLINE, on_result=None, cancel=None, pairs=None):
+    report = fetch_news_report(platforms, topics, deadline, on_result, cancel, pairs)
+    if not (cancel and cancel.is_set()):
+        for platform, topic in report.timed_out:
+            print(f"Timed out fetching {platform} {topic}")
+    return report.stories
+
+
+if __name__ == "__main__":
+    # python fetcher.py [PLATFORM [TOPIC]] -- prints each source as it lands.
+    import sys
+    for platform, topic, stories in iter_news(sys.argv[1:2], sys.argv[2:3]):
+        print(f"== {platform} {topic}")
+        for source, title, link in stories:
+            print(f"[{source}] {title}\n  {link}")
@@ -1,17 +1,106 @@
+import threading
+import time
+
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QPushButton, QScrollArea,
-    QListWidget, QListWidgetItem, QGroupBox
+    QWidget, QVBoxLayout, QLabel, QPushButton, QListView, QLineEdit,
+    QListWidget, QListWidgetItem, QGroupBox, QProgressBar, QMenu,
+    QTableWidget, QTableWidgetItem, QHeaderView, QSplitter, QTextBrowser
 )
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import QTimer, Qt, QObject, QRunnable, QThreadPool, QUrl, pyqtSignal
+from PyQt5.QtGui import QDesktopServices
+
+from scraper.memo import parse_memo
+from search import HeadlineIndex
+from store import normalize_url
+from story_list import StoryModel, StoryDelegate, LinkRole
+
+
+class RefreshSignals(QObject):
+    source_done = pyqtSignal(int, str, str, list)
+    finished = pyqtSignal(int, int)
+
+
+class ArticleSignals(QObject):
+    loaded = pyqtSignal(str, object)
+
+
+class RefreshWorker(QRunnable):
+    """Runs one refresh off the GUI thread, reporting each source as it lands."""
+
+    def __init__(self, generation, fetch_news_callback, platforms, topics, store=None, scheduler=None, pairs=None):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.generation = generation
+        self.fetch_news_callback = fetch_news_callback
+        self.platforms = platforms
+        self.topics = topics
+        self.store = store
+        self.scheduler = scheduler
+        self.pairs = pairs
+        self.results = {}
+        self.cancel = threading.Event()
+        self.signals = RefreshSignals()
+
+    def on_result(self, platform, topic, stories):
+        self.results[(platform, topic)] = stories
+        if not self.cancel.is_set():
+            self.signals.source_done.emit(self.generation, platform, topic, stories)
+
+    def run(self):
+        started = time.time()
+        new_count = 0
+        try:
+            kwargs = {"pairs": self.pairs} if self.pairs is not None else {}
+            self.fetch_news_callback(self.platforms, self.topics, on_result=self.on_result, cancel=self.cancel, **kwargs)
+            if self.scheduler is not None:
+                self.record_schedule()
+            if self.store is not None and self.results:
+                self.store.upsert(self.results)
+                new_count = len(self.store.new_since(started))
+        except Exception as e:
+            print(f"Error refreshing news: {e}")
+        finally:
+            self.signals.finished.emit(self.generation, new_count)
+
+    def record_schedule(self):
+        for key, stories in self.results.items():
+            self.scheduler.record_success(key, stories)
+        if not self.cancel.is_set():
+            for key in self.pairs or ():
+                if key not in self.results:
+                    self.scheduler.record_failure(key)
+        self.scheduler.save()
+
+
+TIMING_COLUMNS = ["Source", "Status", "Stories", "Total", "DNS", "Connect", "TLS", "TTFB", "Download", "Parse", "KB", "Shared"]
+TIMING_PHASES = ["dns", "connect", "tls", "ttfb", "download", "parse"]
+SNAPSHOT_SIZE = 200  # saved stories shown at startup, most recently seen first
+FRESH_FOR = 5 * 60   # seconds a source's stories are reused when the selection changes
+
 
 class NewsApp(QWidget):
-    def __init__(self, fetch_news_callback):
+    def __init__(self, fetch_news_callback, store=None, scheduler=None, metrics=None, sources=None, articles=None):
         super().__init__()
         self.setWindowTitle("News Aggregator")
         self.resize(800, 1000)
         self.fetch_news_callback = fetch_news_callback
+        self.store = store
+        self.scheduler = scheduler
+        self.metrics = metrics
+        self.articles = articles
+        # Valid (platform, topic) pairs; None means every selector combination.
+        self.sources = set(sources) if sources is not None else None
+        if sources is not None:
+            platforms = list(dict.fromkeys(platform for platform, _ in sources))
+            topics = list(dict.fromkeys(topic for _, topic in sources))
+        else:
+            platforms = ["CNN", "NBC", "NPR", "TLDR"]
+            topics = ["World", "US News", "Politics", "Business", "Sports", "Tech", "Infosec", "WebDev", "DevOps", "AI", "Data"]
+        self.thread_pool = QThreadPool.globalInstance()
+        self.workers = {}
+        self.generation = 0
 
-        self.selected_platforms = ["CNN", "NBC", "NPR", "TLDR"]
+        self.selected_platforms = list(platforms)
         self.selected_topics = ["World", "Tech"]
 
         self.layout = QVBoxLayout()
@@ -21,7 +110,7 @@ def __init__(self, fetch_news_callback):
         platform_layout = QVBoxLayout()
         self.platform_selector = QListWidget()
         self.platform_selector.setSelectionMode(QListWidget.MultiSelection)
-        for platform in ["CNN", "NBC", "NPR", "TLDR"]:
+        for platform in platforms:
             item = QListWidgetItem(platform)
             item.setSelected(platform in self.selected_platforms)
             self.platform_selector.addItem(item)
@@ -33,7 +122,7 @@ def __init__(self, fetch_news_callback):
         topic_layout = QVBoxLayout()
         self.topic_selector = QListWidget()
         self.topic_selector.setSelectionMode(QListWidget.MultiSelection)
-        for topic in ["World", "US News", "Politics", "Business", "Sports", "Tech", "Infosec", "WebDev", "DevOps", "AI", "Data"]:
+        for topic in topics:
             item = QListWidgetItem(topic)
             item.setSelected(topic in self.selected_topics)
             self.topic_selector.addItem(item)
@@ -41,24 +130,106 @@ def __init__(self, fetch_news_callback):
         topic_group.setLayout(topic_layout)
         self.layout.addWidget(topic_group)
 
-        self.scroll = QScrollArea()
-        self.inner_widget = QWidget()
-        self.inner_layout = QVBoxLayout()
-        self.inner_widget.setLayout(self.inner_layout)
-        self.scroll.setWidget(self.inner_widget)
-        self.scroll.setWidgetResizable(True)
-        self.layout.addWidget(self.scroll)
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Search headlines...")
+        self.search_box.setClearButtonEnabled(True)
+        self.search_box.textChanged.connect(self.search_headlines)
+        self.layout.addWidget(self.search_box)
+
+        self.story_model = StoryModel(self)
+        self.search_index = HeadlineIndex()
+        self.search_model = StoryModel(self, self.story_model.clusterer)
+        self.story_view = QListView()
+        self.story_view.setModel(self.story_model)
+        self.story_view.setItemDelegate(StoryDelegate(self.story_view))
+        self.story_view.setUniformItemSizes(True)
+        self.story_view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.story_view.customContextMenuRequested.connect(self.show_alternates)
+        if self.articles is None:
+            self.story_view.clicked.connect(self.open_story)
+            self.layout.addWidget(self.story_view)
+        else:
+            # Selecting a story previews it; double-clicking opens the browser.
+            self.story_view.doubleClicked.connect(self.open_story)
+            self.connect_preview()
+            self.preview = QTextBrowser()
+            self.preview.setPlaceholderText("Select a story to preview it")
+            self.preview_link = None
+            self.article_signals = ArticleSignals()
+            self.article_signals.loaded.connect(self.article_loaded)
+            splitter = QSplitter(Qt.Vertical)
+            splitter.addWidget(self.story_view)
+            splitter.addWidget(self.preview)
+            splitter.setSizes([600, 300])
+            self.layout.addWidget(splitter)
+        # (platform, topic) -> (fetched_at, stories) of the latest result.
+        self.pair_results = {}
+        if self.store is not None:
+            threading.Thread(target=self.index_stored_stories, daemon=True).start()
+
+        self.busy = QProgressBar()
+        self.busy.setRange(0, 0)
+        self.busy.setTextVisible(False)
+        self.busy.hide()
+        self.layout.addWidget(self.busy)
+
+        self.status = QLabel()
+        self.layout.addWidget(self.status)
+
+        self.timing_group = QGroupBox("Source Timings (ms)")
+        timing_layout = QVBoxLayout()
+        self.timing_table = QTableWidget(0, len(TIMING_COLUMNS))
+        self.timing_table.setHorizontalHeaderLabels(TIMING_COLUMNS)
+        self.timing_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.timing_table.verticalHeader().hide()
+        self.timing_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.timing_table.setMaximumHeight(200)
+        timing_layout.addWidget(self.timing_table)
+        self.timing_group.setLayout(timing_layout)
+        self.timing_group.hide()
+        self.layout.addWidget(self.timing_group)
 
         refresh_button = QPushButton("Refresh News")
         refresh_button.setStyleSheet("padding: 10px; font-weight: bold;")
         refresh_button.clicked.connect(self.refresh_news)
         self.layout.addWidget(refresh_button)
 
+        # With a scheduler each source is polled when it is due; otherwise
+        # everything selected is refreshed on a fixed interval.
         self.timer = QTimer()
-        self.timer.timeout.connect(self.refresh_news)
-        self.timer.start(30 * 60 * 1000)
+        if self.scheduler is not None:
+            self.timer.timeout.connect(self.refresh_due)
+            self.timer.start(60 * 1000)
+        else:
+            self.timer.timeout.connect(self.refresh_news)
+            self.timer.start(30 * 60 * 1000)
 
-        self.refresh_news()
+        # Selection changes are applied once the clicking stops.
+        self.selection_timer = QTimer()
+        self.selection_timer.setSingleShot(True)
+        self.selection_timer.setInterval(300)
+        self.selection_timer.timeout.connect(self.refresh_selection)
+        self.platform_selector.itemSelectionChanged.connect(self.selection_timer.start)
+        self.topic_selector.itemSelectionChanged.connect(self.selection_timer.start)
+
+        if self.store is not None:
+            self.show_stored_stories()
+        # Let the window paint first; the network refresh runs in the background.
+        QTimer.singleShot(0, self.refresh_selection)
+
+    def show_stored_stories(self):
+        """Fill the list with the last persisted snapshot of the selected sources."""
+        rows = self.store.latest(SNAPSHOT_SIZE, self.selected_platforms or None, self.selected_topics or None)
+        # Rows come newest first and each refresh stores its stories with one
+        # timestamp, so the first row of a source dates its latest fetch.
+        for row in rows:
+            key = (row["platform"], row["topic"])
+            fetched_at, stories = self.pair_results.setdefault(key, (row["last_seen"], []))
+            if row["last_seen"] == fetched_at:
+                stories.append((row["source"], row["title"], row["link"]))
+        self.show_selection()
+        if rows:
+            self.status.setText(f"Showing {self.story_model.rowCount()} saved stories while refreshing")
 
     def get_selected_platforms(self):
         return [item.text() for item in self.platform_selector.selectedItems()]
@@ -66,17 +237,171 @@ def get_selected_platforms(self):
     def get_selected_topics(self):
         return [item.text() for item in self.topic_selector.selectedItems()]
 
-    def refresh_news(self):
+    def read_selection(self):
         self.selected_platforms = self.get_selected_platforms()
         self.selected_topics = self.get_selected_topics()
-        stories = self.fetch_news_callback(self.selected_platforms, self.selected_topics)
 
-        for i in reversed(range(self.inner_layout.count())):
-            self.inner_layout.itemAt(i).widget().setParent(None)
+    def selected_pairs(self):
+        # An empty selection means everything, as in fetch_news.
+        platforms = self.selected_platforms or [self.platform_selector.item(i).text() for i in range(self.platform_selector.count())]
+        topics = self.selected_topics or [self.topic_selector.item(i).text() for i in range(self.topic_selector.count())]
+        pairs = [(platform, topic) for platform in platforms for topic in topics]
+        return pairs if self.sources is None else [key for key in pairs if key in self.sources]
+
+    def refresh_news(self):
+        """Re-fetch every selected source."""
+        for worker in self.workers.values():
+            worker.cancel.set()
+        self.read_selection()
+        self.show_selection()
+        self.start_refresh(self.selected_pairs())
+
+    def refresh_selection(self):
+        """Apply a selection change, fetching only sources without fresh results."""
+        self.read_selection()
+        self.show_selection()
+        now = time.time()
+        in_flight = {key for worker in self.workers.values() if not worker.cancel.is_set() for key in worker.pairs}
+        pairs = [
+            key for key in self.selected_pairs()
+            if key not in in_flight and now - self.pair_results.get(key, (0, None))[0] > FRESH_FOR
+        ]
+        if pairs:
+            self.start_refresh(pairs)
+
+    def show_selection(self):
+        """Show the latest stories of the selected sources and nothing else."""
+        links = set()
+        for key, (_, stories) in self.pair_results.items():
+            if self.is_selected(*key):
+                self.story_model.add_stories(stories)
+                links.update(link for _, _, link in stories)
+        self.story_model.retain(links)
+
+    def refresh_due(self):
+        """Refresh only the selected sources whose polling interval has elapsed."""
+        if self.workers:
+            return
+        pairs = [key for key in self.scheduler.due() if self.is_selected(*key)]
+        if pairs:
+            self.start_refresh(pairs)
+
+    def is_selected(self, platform, topic):
+        return ((not self.selected_platforms or platform in self.selected_platforms)
+                and (not self.selected_topics or topic in self.selected_topics))
+
+    def start_refresh(self, pairs):
+        self.generation += 1
+        worker = RefreshWorker(self.generation, self.fetch_news_callback,
+                               self.selected_platforms, self.selected_topics, self.store,
+                               self.scheduler, pairs)
+        worker.signals.source_done.connect(self.add_stories)
+        worker.signals.finished.connect(self.refresh_finished)
+        # Cancelled workers stay referenced until they finish so their
+        # signals object outlives the background thread.
+        self.workers[self.generation] = worker
+        self.busy.show()
+        self.thread_pool.start(worker)
+
+    def add_stories(self, generation, platform, topic, stories):
+        # Results of any running refresh are kept; cancelled ones stop emitting.
+        self.pair_results[(platform, topic)] = (time.time(), stories)
+        if self.is_selected(platform, topic):
+            self.story_model.add_stories(stories)
+        for story in stories:
+            self.search_index.add(normalize_url(story[2]), story[1], story)
+        if self.search_box.text().strip():
+            self.search_headlines(self.search_box.text())
+
+    def refresh_finished(self, generation, new_count):
+        worker = self.workers.pop(generation, None)
+        if not any(not w.cancel.is_set() for w in self.workers.values()):
+            self.busy.hide()
+        if worker is None or worker.cancel.is_set():
+            return
+        if self.store is not None:
+            self.status.setText(f"{new_count} new stories since the last refresh")
+        # Sources that failed or were not fetched keep their previous stories.
+        self.show_selection()
+        if self.metrics is not None:
+            self.show_timings(self.metrics.snapshot())
+        if self.articles is not None:
+            self.articles.prefetch(link for _, _, link in self.story_model.stories())
+
+    def show_timings(self, items):
+        """Fill the timings panel, slowest source first."""
+        items = sorted(items, key=lambda item: item["duration"], reverse=True)
+        self.timing_table.setRowCount(len(items))
+        for row, item in enumerate(items):
+            statuses = ", ".join(f"{code}x{n}" if n > 1 else code for code, n in sorted(item["statuses"].items()))
+            if item["error"]:
+                status = "timed out" if item["error"] == "timed out" else "failed"
+            else:
+                status = statuses or "-"
+            cells = [f"{item['platform']} {item['topic']}", status, str(item["stories"]), f"{item['duration'] * 1000:.0f}"]
+            cells += [f"{item['phases'][phase] * 1000:.0f}" for phase in TIMING_PHASES]
+            cells.append(f"{item['bytes'] / 1024:.0f}")
+            cells.append(str(item["deduplicated"]))
+            for column, text in enumerate(cells):
+                cell = QTableWidgetItem(text)
+                if column == 1 and item["error"]:
+                    cell.setToolTip(item["error"])
+                self.timing_table.setItem(row, column, cell)
+        memo = parse_memo.stats()
+        self.timing_group.setTitle(f"Source Timings (ms) - unchanged pages: {memo['hits']} of {memo['hits'] + memo['misses']} parses skipped")
+        self.timing_group.setVisible(bool(items))
+
+    def index_stored_stories(self):
+        for row in self.store.latest(limit=None):
+            self.search_index.add(row["url_key"], row["title"], (row["source"], row["title"], row["link"]))
+
+    def search_headlines(self, text):
+        if not text.strip():
+            self.show_model(self.story_model)
+            return
+        self.search_model.clear()
+        self.search_model.add_stories(self.search_index.search(text))
+        self.show_model(self.search_model)
+
+    def show_model(self, model):
+        if self.story_view.model() is not model:
+            self.story_view.setModel(model)
+            self.connect_preview()
+
+    def open_story(self, index):
+        QDesktopServices.openUrl(QUrl(index.data(LinkRole)))
+
+    def connect_preview(self):
+        # setModel replaces the selection model, so this follows each model swap.
+        if self.articles is not None:
+            self.story_view.selectionModel().currentChanged.connect(self.show_preview)
+
+    def show_preview(self, index, previous=None):
+        """Show the article text of a story, prefetched in the common case."""
+        if not index.isValid():
+            return
+        self.preview_link = index.data(LinkRole)
+        text = self.articles.cached(self.preview_link)
+        if text is not None:
+            self.show_article(text)
+            return
+        self.preview.setPlainText("Loading preview...")
+        self.articles.load(self.preview_link, self.article_signals.loaded.emit)
+
+    def article_loaded(self, link, text):
+        if link == self.preview_link:
+            self.show_article(text)
+
+    def show_article(self, text):
+        self.preview.setPlainText(text or "No preview available. Double-click the story to open it in the browser.")
+        self.preview.verticalScrollBar().setValue(0)
 
-        for source, title, link in stories:
-            lbl = QLabel(f"<b>[{source}]</b> <a href='{link}'>{title}</a>")
-            lbl.setOpenExternalLinks(True)
-            lbl.setWordWrap(True)
-            lbl.setTextInteractionFlags(Qt.TextBrowserInteraction)
-            self.inner_layout.addWidget(lbl)
+    def show_alternates(self, pos):
+        index = self.story_view.indexAt(pos)
+        if not index.isValid():
+            return
+        menu = QMenu(self)
+        for source, title, link in self.story_view.model().cluster(index.row()):
+            action = menu.addAction(f"[{source}] {title}")
+            action.triggered.connect(lambda _, link=link: QDesktopServices.openUrl(QUrl(link)))
+        menu.exec_(self.story_view.viewport().mapToGlobal(pos))
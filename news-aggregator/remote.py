@@ -0,0 +1,33 @@
+import json
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+REMOTE_TIMEOUT = 5
+
+
+def remote_fetch_news(base_url):
+    """Return a ``fetch_news``-compatible callback that reads from a running daemon."""
+
+    def fetch_news(platforms, topics, deadline=REMOTE_TIMEOUT, on_result=None, cancel=None, pairs=None):
+        if pairs is not None:
+            platforms = sorted({p for p, _ in pairs})
+            topics = sorted({t for _, t in pairs})
+        query = urlencode([("platform", p) for p in platforms or []] + [("topic", t) for t in topics or []])
+        with urlopen(f"{base_url.rstrip('/')}/stories?{query}", timeout=deadline) as res:
+            items = json.load(res)["stories"]
+
+        grouped = {}
+        for item in items:
+            grouped.setdefault((item["platform"], item["topic"]), []).append((item["source"], item["title"], item["link"]))
+        stories = []
+        for (platform, topic), batch in grouped.items():
+            if pairs is not None and (platform, topic) not in pairs:
+                continue
+            if cancel and cancel.is_set():
+                break
+            if on_result:
+                on_result(platform, topic, batch)
+            stories += batch
+        return stories
+
+    return fetch_news
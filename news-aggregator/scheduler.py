@@ -0,0 +1,124 @@
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+
+from scraper.cache import CACHE_DIR
+
+STATE_PATH = CACHE_DIR / "schedule.json"
+MIN_INTERVAL = 10 * 60
+MAX_INTERVAL = 24 * 60 * 60
+DEFAULT_INTERVAL = 30 * 60
+MAX_BACKOFF = 6 * 60 * 60
+TARGET_CHANGE = 0.5     # chance that a poll finds new content
+DECAY = 0.8             # weight kept by older observations at each poll
+
+
+def content_hash(stories):
+    digest = hashlib.blake2b(digest_size=16)
+    for source, title, link in stories:
+        digest.update(f"{title}\x00{link}\x00".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class AdaptiveScheduler:
+    """Per-source polling intervals learned from how often content changes.
+
+    Each source's changes are treated as a Poisson process. A poll only
+    reveals whether anything changed since the previous one, so the rate is
+    estimated from the decayed fraction of polls that saw no change:
+    ``rate = -ln(unchanged / polls) / mean_interval``.
+    The next poll is placed where a change is ``TARGET_CHANGE`` likely, so
+    fast-moving pages are polled often and daily ones rarely. Failures back
+    off exponentially from the learned interval.
+    """
+
+    def __init__(self, sources, state_path=STATE_PATH):
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        now = time.time()
+        saved = self._load()
+        self._states = {}
+        for platform, topic in sources:
+            state = saved.get(f"{platform}/{topic}", {})
+            self._states[(platform, topic)] = {
+                "interval": state.get("interval", DEFAULT_INTERVAL),
+                "polls": state.get("polls", 0.0),
+                "unchanged": state.get("unchanged", 0.0),
+                "observed": state.get("observed", 0.0),
+                "hash": state.get("hash"),
+                "last_poll": state.get("last_poll"),
+                "next_due": min(state.get("next_due", now), now + MAX_INTERVAL),
+                "failures": 0,
+            }
+
+    def _load(self):
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        with self._lock:
+            data = {f"{p}/{t}": {k: v for k, v in s.items() if k != "failures"} for (p, t), s in self._states.items()}
+        tmp = self.state_path.with_name(f"{self.state_path.name}.{os.getpid()}.tmp")
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.state_path)
+        except OSError as e:
+            print(f"Error saving schedule: {e}")
+
+    def sources(self):
+        return list(self._states)
+
+    def due(self, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            return [key for key, state in self._states.items() if state["next_due"] <= now]
+
+    def next_due(self, key):
+        with self._lock:
+            return self._states[key]["next_due"]
+
+    def interval(self, key):
+        with self._lock:
+            return self._states[key]["interval"]
+
+    def record_success(self, key, stories, now=None):
+        now = time.time() if now is None else now
+        digest = content_hash(stories)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                return
+            if state["hash"] is not None and state["last_poll"] is not None:
+                state["polls"] = DECAY * state["polls"] + 1
+                state["unchanged"] = DECAY * state["unchanged"] + (digest == state["hash"])
+                state["observed"] = DECAY * state["observed"] + max(now - state["last_poll"], 1.0)
+                # The +0.5 terms keep the estimate finite when every poll changed.
+                unchanged = (state["unchanged"] + 0.5) / (state["polls"] + 0.5)
+                rate = -math.log(unchanged) / (state["observed"] / state["polls"])
+                if rate > 0:
+                    interval = -math.log(1 - TARGET_CHANGE) / rate
+                else:
+                    interval = MAX_INTERVAL
+                state["interval"] = min(MAX_INTERVAL, max(MIN_INTERVAL, interval))
+            state["hash"] = digest
+            state["last_poll"] = now
+            state["failures"] = 0
+            state["next_due"] = now + state["interval"]
+
+    def record_failure(self, key, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                return
+            state["failures"] += 1
+            backoff = min(MAX_BACKOFF, state["interval"] * 2 ** (state["failures"] - 1))
+            state["next_due"] = now + backoff
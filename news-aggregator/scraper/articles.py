@@ -0,0 +1,168 @@
+#scraper/articles.py
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from scraper.cache import CACHE_DIR, HTTPCache
+from scraper.coalesce import inflight
+
+PREFETCH_COUNT = int(os.environ.get("NEWS_PREFETCH", "10"))  # top stories prefetched after a refresh
+PREFETCH_WORKERS = 2
+MEMORY_ITEMS = 100
+DISK_BYTES = 20 * 1024 * 1024
+MAX_TEXT_CHARS = 20000
+MIN_PARAGRAPH = 40  # shorter <p>s are bylines, captions and buttons
+BOILERPLATE = ["script", "style", "noscript", "nav", "header", "footer", "aside", "form", "figure", "iframe", "svg"]
+
+
+def extract_text(html):
+    """Return the title and main body text of an article page.
+
+    The body is the run of paragraphs under the element whose direct
+    ``<p>`` children hold the most text, which skips navigation, related
+    links and other page furniture without site-specific selectors.
+    """
+    from bs4 import BeautifulSoup
+    from scraper.parsing import HAVE_LXML
+
+    soup = BeautifulSoup(html, "lxml" if HAVE_LXML else "html.parser")
+    meta = soup.find("meta", property="og:title")
+    heading = soup.find("h1")
+    if meta and meta.get("content"):
+        title = meta["content"].strip()
+    elif heading:
+        title = heading.get_text(" ", strip=True)
+    else:
+        title = soup.title.get_text(strip=True) if soup.title else ""
+    for tag in soup(BOILERPLATE):
+        tag.decompose()
+
+    blocks = {}
+    for paragraph in soup.find_all("p"):
+        text = " ".join(paragraph.get_text(" ", strip=True).split())
+        if len(text) < MIN_PARAGRAPH:
+            continue
+        block = blocks.setdefault(id(paragraph.parent), [0, []])
+        block[0] += len(text)
+        block[1].append(text)
+    paragraphs = max(blocks.values(), key=lambda block: block[0])[1] if blocks else []
+    return "\n\n".join([title] + paragraphs if title else paragraphs)[:MAX_TEXT_CHARS]
+
+
+class ArticleCache:
+    """Extracted article text by URL: a small in-memory LRU in front of an
+    on-disk LRU (an ``HTTPCache`` without validators) that survives restarts."""
+
+    def __init__(self, directory=CACHE_DIR / "articles", memory_items=MEMORY_ITEMS, disk_bytes=DISK_BYTES):
+        self.memory_items = memory_items
+        self.disk = HTTPCache(directory, disk_bytes)
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def peek(self, url):
+        """The text of ``url`` if it is in memory; never touches the disk."""
+        with self._lock:
+            text = self._memory.get(url)
+            if text is not None:
+                self._memory.move_to_end(url)
+            return text
+
+    def get(self, url):
+        with self._lock:
+            text = self._memory.get(url)
+            if text is not None:
+                self._memory.move_to_end(url)
+                return text
+        cached = self.disk.load(url)
+        if cached is None:
+            return None
+        text = cached[0].decode("utf-8", errors="replace")
+        self._remember(url, text)
+        return text
+
+    def put(self, url, text):
+        self._remember(url, text)
+        self.disk.store(url, text.encode("utf-8"))
+
+    def _remember(self, url, text):
+        with self._lock:
+            self._memory[url] = text
+            self._memory.move_to_end(url)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+
+class ArticlePrefetcher:
+    """Fetches and extracts article text in the background.
+
+    ``prefetch`` queues the top stories of a refresh on a small pool,
+    dropping whatever an earlier refresh queued that has not started yet;
+    ``load`` fetches one article on demand (for a preview that missed the
+    cache) on its own worker, so it never waits behind the prefetch queue.
+    Both share in-flight fetches of the same URL.
+    """
+
+    def __init__(self, cache=None, workers=PREFETCH_WORKERS, count=PREFETCH_COUNT):
+        self.cache = cache if cache is not None else ArticleCache()
+        self.count = count
+        self._prefetch_pool = ThreadPoolExecutor(workers, thread_name_prefix="prefetch")
+        self._demand_pool = ThreadPoolExecutor(1, thread_name_prefix="preview")
+        self._queued = []
+        self._lock = threading.Lock()
+
+    def cached(self, url):
+        """Text already in memory, cheap enough for the GUI thread; a miss
+        is resolved (from disk or the network) by ``load``."""
+        return self.cache.peek(url)
+
+    def fetch(self, url):
+        """Return the text of ``url``, from the cache or the network."""
+        text = self.cache.get(url)
+        if text is not None:
+            return text
+        return inflight.run(("article", url), lambda: self._fetch(url))
+
+    def _fetch(self, url):
+        # Imported here so that creating the prefetcher keeps startup cheap.
+        from scraper import client, procpool
+
+        # Article pages trip their own breaker, not the section pages' one.
+        res = client.get(url, scope="articles")
+        res.raise_for_status()
+        if "html" not in res.headers.get("Content-Type", "text/html"):
+            raise ValueError(f"not an HTML page ({res.headers['Content-Type']})")
+        text = procpool.run(extract_text, res.text)
+        self.cache.put(url, text)
+        return text
+
+    def _prefetch_one(self, url):
+        try:
+            self.fetch(url)
+        except Exception as e:
+            print(f"Error prefetching {url}: {e}")
+
+    def prefetch(self, urls):
+        # Cached URLs are skipped by fetch() on the worker, off the caller's thread.
+        urls = list(dict.fromkeys(urls))[:self.count]
+        with self._lock:
+            for future in self._queued:
+                future.cancel()
+            self._queued = [self._prefetch_pool.submit(self._prefetch_one, url) for url in urls]
+        return len(urls)
+
+    def load(self, url, callback):
+        """Fetch ``url`` in the background and call ``callback(url, text)``;
+        ``text`` is None when the article could not be loaded."""
+        def run():
+            try:
+                text = self.fetch(url)
+            except Exception as e:
+                print(f"Error loading {url}: {e}")
+                text = None
+            callback(url, text)
+        self._demand_pool.submit(run)
+
+    def shutdown(self):
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        self._demand_pool.shutdown(wait=False, cancel_futures=True)
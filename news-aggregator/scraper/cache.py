@@ -0,0 +1,137 @@
+#scraper/cache.py
+import atexit
+import hashlib
+import json
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+
+CACHE_DIR = Path(os.environ.get("NEWS_AGGREGATOR_CACHE", Path.home() / ".cache" / "news-aggregator"))
+MAX_CACHE_BYTES = int(os.environ.get("NEWS_AGGREGATOR_CACHE_MB", "50")) * 1024 * 1024
+
+_caches = weakref.WeakSet()
+
+
+class HTTPCache:
+    """On-disk store of response bodies plus their ETag/Last-Modified validators.
+
+    Entries are kept in least-recently-used order; once the stored bodies
+    exceed ``max_bytes`` the oldest ones are evicted. The index is only
+    written by ``flush`` (after each refresh and at exit), and only when an
+    entry was added or evicted since the last write.
+    """
+
+    def __init__(self, directory, max_bytes=MAX_CACHE_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._index_path = self.directory / "index.json"
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._size = 0
+        self._dirty = False
+        self._load_index()
+        _caches.add(self)
+
+    def _body_path(self, url):
+        return self.directory / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".body")
+
+    def _load_index(self):
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        for url, entry in entries:
+            if self._body_path(url).exists():
+                self._entries[url] = entry
+                self._size += entry["size"]
+
+    def _save_index(self):
+        tmp = self._index_path.with_name(f"index.json.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(list(self._entries.items()), f)
+            os.replace(tmp, self._index_path)
+        except OSError as e:
+            print(f"Error saving HTTP cache index: {e}")
+
+    def validators(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return {}
+            headers = {}
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+            return headers
+
+    def load(self, url):
+        """Return ``(body, encoding)`` for a cached URL, or None."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            try:
+                body = self._body_path(url).read_bytes()
+            except OSError:
+                self._drop(url)
+                return None
+            self._entries.move_to_end(url)
+            return body, entry["encoding"]
+
+    def store(self, url, body, etag=None, last_modified=None, encoding="utf-8"):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                path = self._body_path(url)
+                tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                tmp.write_bytes(body)
+                os.replace(tmp, path)
+            except OSError as e:
+                print(f"Error caching {url}: {e}")
+                return
+            if url in self._entries:
+                self._size -= self._entries.pop(url)["size"]
+            self._entries[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "encoding": encoding,
+                "size": len(body),
+            }
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+            self._dirty = True
+
+    def flush(self):
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+                self._dirty = False
+
+    def _drop(self, url):
+        entry = self._entries.pop(url, None)
+        if entry is None:
+            return
+        self._size -= entry["size"]
+        self._dirty = True
+        try:
+            self._body_path(url).unlink()
+        except OSError:
+            pass
+
+
+def flush_all():
+    """Write the index of every cache with unsaved changes."""
+    for cache in list(_caches):
+        cache.flush()
+
+
+atexit.register(flush_all)
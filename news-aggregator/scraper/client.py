@@ -0,0 +1,188 @@
+#scraper/client.py
+import os
+import socket
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+from scraper import metrics
+from scraper.cache import HTTPCache, CACHE_DIR
+from scraper.coalesce import inflight
+from scraper.replay import from_replay, to_replay
+from scraper.resilience import call
+
+try:
+    import brotli  # noqa: F401  (lets urllib3 decode "br" responses)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
+DEFAULT_TIMEOUT = 10
+POOL_HOSTS = 8     # distinct hosts kept in the pool manager
+POOL_SIZE = 16     # keep-alive connections kept per host
+
+# When set (e.g. to a scraper.replay server), requests go to the replay
+# server instead of the live site; see scraper/replay.py.
+REPLAY_URL = os.environ.get("NEWS_REPLAY")
+
+# Callables ``observer(url, response)`` called after every GET.
+observers = []
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+# DNS/connect/TLS time spent opening connections in this thread since the
+# last request started; all zero when a pooled connection was reused.
+_connection_timings = threading.local()
+
+
+def _add_connection_time(phase, seconds):
+    setattr(_connection_timings, phase, getattr(_connection_timings, phase, 0.0) + seconds)
+
+
+class TimedHTTPConnection(HTTPConnection):
+    def _new_conn(self):
+        # Resolve here so DNS and TCP connect can be timed separately, then
+        # let urllib3 connect to each address in turn.
+        host = self._dns_host
+        start = time.perf_counter()
+        try:
+            infos = socket.getaddrinfo(host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except OSError:
+            return super()._new_conn()
+        resolved = time.perf_counter()
+        _add_connection_time("dns", resolved - start)
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        try:
+            for i, address in enumerate(addresses):
+                self._dns_host = address
+                try:
+                    sock = super()._new_conn()
+                    break
+                except (ConnectTimeoutError, NewConnectionError):
+                    if i == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = host
+            _add_connection_time("connect", time.perf_counter() - resolved)
+        return sock
+
+
+class TimedHTTPSConnection(TimedHTTPConnection, HTTPSConnection):
+    def connect(self):
+        before = getattr(_connection_timings, "dns", 0.0) + getattr(_connection_timings, "connect", 0.0)
+        start = time.perf_counter()
+        super().connect()
+        after = getattr(_connection_timings, "dns", 0.0) + getattr(_connection_timings, "connect", 0.0)
+        _add_connection_time("tls", time.perf_counter() - start - (after - before))
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
+
+
+def _new_session():
+    session = requests.Session()
+    adapter = TimedHTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(HEADERS)
+    return session
+
+
+_session = _new_session()
+
+
+def _send(url, **kwargs):
+    """One GET whose phase timings go to the current source's metrics."""
+    _connection_timings.__dict__.clear()
+    start = time.perf_counter()
+    res = _session.get(url, **kwargs)
+    total = time.perf_counter() - start
+    source = metrics.current()
+    if source is not None:
+        setup = {phase: getattr(_connection_timings, phase, 0.0) for phase in ("dns", "connect", "tls")}
+        headers_at = sum(r.elapsed.total_seconds() for r in res.history + [res])
+        # A streamed body is read (and timed) by the caller.
+        streamed = kwargs.get("stream", False)
+        source.add_request(
+            res.status_code, 0 if streamed else len(res.content),
+            ttfb=max(0.0, headers_at - sum(setup.values())),
+            download=0.0 if streamed else max(0.0, total - headers_at),
+            **setup,
+        )
+    return res
+
+
+def get(url, scope=None, **kwargs):
+    """GET ``url`` under the host's rate limit, retry policy and circuit
+    breaker (a separate one per ``scope``, see ``resilience.call``)."""
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    if REPLAY_URL:
+        res = call(url, lambda: _send(to_replay(REPLAY_URL, url), **kwargs), scope)
+        res.url = from_replay(REPLAY_URL, res.url)
+    else:
+        res = call(url, lambda: _send(url, **kwargs), scope)
+    for observer in observers:
+        observer(url, res)
+    return res
+
+
+def stream(url, **kwargs):
+    """GET ``url`` without reading the body; use as a context manager."""
+    return get(url, stream=True, **kwargs)
+
+
+http_cache = HTTPCache(CACHE_DIR / "http")
+
+
+def fetch_text(url):
+    """GET ``url`` with conditional-request validators and return its text.
+
+    A 304 response is answered from the on-disk cache; a fresh 200 with an
+    ETag or Last-Modified header replaces the cached copy. Concurrent
+    requests for the same URL share one fetch.
+    """
+    return inflight.run(("text", url), lambda: _fetch_text(url))
+
+
+def _fetch_text(url):
+    res = get(url, headers=http_cache.validators(url))
+    if res.status_code == 304:
+        cached = http_cache.load(url)
+        if cached is not None:
+            body, encoding = cached
+            return body.decode(encoding, errors="replace")
+        res = get(url)
+    res.raise_for_status()
+
+    etag = res.headers.get("ETag")
+    last_modified = res.headers.get("Last-Modified")
+    if etag or last_modified:
+        http_cache.store(url, res.content, etag, last_modified, res.encoding or res.apparent_encoding)
+    return res.text
@@ -0,0 +1,55 @@
+#scraper/coalesce.py
+import threading
+from concurrent.futures import Future
+
+from scraper import metrics
+
+
+class Coalescer:
+    """Lets concurrent callers asking for the same key share one in-flight call.
+
+    The first caller for a key runs the work; callers arriving while it is
+    still running wait for and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self.calls = 0
+        self.deduplicated = 0
+
+    def run(self, key, func):
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+                self.calls += 1
+            else:
+                self.deduplicated += 1
+        if not owner:
+            # Also counted for the source (and so the refresh) that joined.
+            source = metrics.current()
+            if source is not None:
+                source.add_deduplicated()
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def stats(self):
+        with self._lock:
+            return {"calls": self.calls, "deduplicated": self.deduplicated, "in_flight": len(self._inflight)}
+
+
+# Every network fetch (and the parse that follows it) goes through this table.
+inflight = Coalescer()
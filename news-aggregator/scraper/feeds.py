@@ -0,0 +1,79 @@
+#scraper/feeds.py
+from urllib.parse import urljoin
+from xml.etree.ElementTree import XMLPullParser
+
+from scraper import client, metrics
+from scraper.coalesce import inflight
+
+CHUNK_SIZE = 16 * 1024
+MAX_BYTES = 2 * 1024 * 1024
+
+
+def _local(tag):
+    return tag.rpartition("}")[2]
+
+
+def _entry(element, url):
+    """Return ``(title, link)`` of an RSS ``<item>`` or Atom ``<entry>``."""
+    title = link = ""
+    for child in element:
+        name = _local(child.tag)
+        if name == "title":
+            title = " ".join("".join(child.itertext()).split())
+        elif name == "link" and not link:
+            # RSS puts the URL in the text, Atom in href (rel="alternate").
+            if child.get("rel", "alternate") == "alternate":
+                link = (child.get("href") or child.text or "").strip()
+    return title, urljoin(url, link) if link else ""
+
+
+def parse_feed(chunks, url, source, max_count=10):
+    """Pull headlines out of RSS or Atom fed as byte ``chunks``.
+
+    Parsing is incremental, so iteration over ``chunks`` stops as soon as
+    ``max_count`` unique stories are found.
+    """
+    parser = XMLPullParser(events=("end",))
+    stories = []
+    seen = set()
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            if _local(element.tag) not in ("item", "entry"):
+                continue
+            title, link = _entry(element, url)
+            element.clear()
+            if title and link and link not in seen:
+                seen.add(link)
+                stories.append((source, title, link))
+                if len(stories) >= max_count:
+                    return stories
+    # Not closed: a feed cut short at MAX_BYTES still yields its whole items.
+    return stories
+
+
+def scrape_feed(url, source, max_count=10):
+    """Fetch an RSS/Atom feed and return its top ``(source, title, link)`` stories."""
+    return list(inflight.run(("feed", url, source, max_count), lambda: _scrape_feed(url, source, max_count)))
+
+
+def _scrape_feed(url, source, max_count):
+    received = 0
+
+    def chunks(res):
+        nonlocal received
+        for chunk in res.iter_content(CHUNK_SIZE):
+            received += len(chunk)
+            yield chunk
+            if received >= MAX_BYTES:
+                return
+
+    # As in streaming.py, reading and parsing are interleaved and both
+    # count as download time.
+    with client.stream(url) as res, metrics.timed("download"):
+        res.raise_for_status()
+        try:
+            return parse_feed(chunks(res), url, source, max_count)
+        finally:
+            if metrics.current() is not None:
+                metrics.current().add_bytes(received)
@@ -0,0 +1,181 @@
+#scraper/metrics.py
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+PHASES = ("dns", "connect", "tls", "ttfb", "download", "parse")
+
+_current = ContextVar("source_metrics", default=None)
+
+
+class SourceMetrics:
+    """Timings and counters for one scraper call (one platform/topic unit).
+
+    Phase times are summed over every request the call made; ``dns``,
+    ``connect`` and ``tls`` stay at zero when pooled connections were reused.
+    """
+
+    def __init__(self, platform, topic):
+        self.platform = platform
+        self.topic = topic
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.requests = 0
+        self.bytes = 0
+        self.statuses = {}
+        self.stories = 0
+        self.deduplicated = 0
+        self.error = None
+        self.started_at = time.time()
+        self.duration = 0.0
+        self._lock = threading.Lock()
+
+    def add_phase(self, phase, seconds):
+        with self._lock:
+            self.phases[phase] += seconds
+
+    def add_request(self, status, nbytes, **phases):
+        with self._lock:
+            self.requests += 1
+            self.bytes += nbytes
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            for phase, seconds in phases.items():
+                self.phases[phase] += seconds
+
+    def add_bytes(self, nbytes):
+        with self._lock:
+            self.bytes += nbytes
+
+    def add_deduplicated(self):
+        with self._lock:
+            self.deduplicated += 1
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                "platform": self.platform,
+                "topic": self.topic,
+                "started_at": self.started_at,
+                "duration": self.duration,
+                "phases": dict(self.phases),
+                "requests": self.requests,
+                "bytes": self.bytes,
+                "statuses": {str(code): n for code, n in self.statuses.items()},
+                "stories": self.stories,
+                "deduplicated": self.deduplicated,
+                "error": self.error,
+            }
+
+
+@contextmanager
+def collect(metrics):
+    """Attribute requests and parses made in this context to ``metrics``."""
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
+
+
+def current():
+    return _current.get()
+
+
+@contextmanager
+def timed(phase):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.add_phase(phase, time.perf_counter() - start)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+class MetricsRegistry:
+    """Latest metrics per source plus cumulative counters, with exporters.
+
+    Every recorded source is also appended as one JSON line to ``log_path``
+    when it is set (NEWS_METRICS_LOG).
+    """
+
+    def __init__(self, log_path=None):
+        self.log_path = log_path
+        self._lock = threading.Lock()
+        self._latest = {}
+        self._requests_total = {}
+        self._errors_total = {}
+
+    def record(self, metrics):
+        item = metrics.as_dict()
+        key = (metrics.platform, metrics.topic)
+        with self._lock:
+            self._latest[key] = item
+            for status, n in item["statuses"].items():
+                counter = key + (status,)
+                self._requests_total[counter] = self._requests_total.get(counter, 0) + n
+            if item["error"]:
+                self._errors_total[key] = self._errors_total.get(key, 0) + 1
+            if self.log_path:
+                try:
+                    with open(self.log_path, "a", encoding="utf-8") as f:
+                        f.write(json.dumps(item) + "\n")
+                except OSError as e:
+                    print(f"Error writing metrics log: {e}")
+
+    def snapshot(self):
+        with self._lock:
+            return [self._latest[key] for key in sorted(self._latest)]
+
+    def jsonl(self):
+        return "".join(json.dumps(item) + "\n" for item in self.snapshot())
+
+    def prometheus(self):
+        """Render the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            latest = [self._latest[key] for key in sorted(self._latest)]
+            requests_total = sorted(self._requests_total.items())
+            errors_total = sorted(self._errors_total.items())
+
+        lines = [
+            "# HELP news_source_phase_seconds Time spent per phase in the last fetch of a source.",
+            "# TYPE news_source_phase_seconds gauge",
+        ]
+        for item in latest:
+            for phase in PHASES:
+                labels = _labels(platform=item["platform"], topic=item["topic"], phase=phase)
+                lines.append(f"news_source_phase_seconds{labels} {item['phases'][phase]:.6f}")
+        gauges = [
+            ("duration_seconds", "duration", "Wall time of the last fetch of a source."),
+            ("bytes", "bytes", "Bytes downloaded by the last fetch of a source."),
+            ("stories", "stories", "Stories returned by the last fetch of a source."),
+            ("deduplicated", "deduplicated", "Fetches in the last fetch of a source that joined an identical in-flight request."),
+            ("last_fetch_timestamp_seconds", "started_at", "Unix time the last fetch of a source started."),
+        ]
+        for name, field, help_text in gauges:
+            lines += [f"# HELP news_source_{name} {help_text}", f"# TYPE news_source_{name} gauge"]
+            for item in latest:
+                labels = _labels(platform=item["platform"], topic=item["topic"])
+                lines.append(f"news_source_{name}{labels} {item[field]}")
+        lines += ["# HELP news_source_requests_total HTTP responses by status code.",
+                  "# TYPE news_source_requests_total counter"]
+        for (platform, topic, status), n in requests_total:
+            lines.append(f"news_source_requests_total{_labels(platform=platform, topic=topic, status=status)} {n}")
+        lines += ["# HELP news_source_errors_total Fetches that failed or timed out.",
+                  "# TYPE news_source_errors_total counter"]
+        for (platform, topic), n in errors_total:
+            lines.append(f"news_source_errors_total{_labels(platform=platform, topic=topic)} {n}")
+        return "\n".join(lines) + "\n"
+
+
+source_metrics = MetricsRegistry(os.environ.get("NEWS_METRICS_LOG"))
@@ -0,0 +1,31 @@
+#scraper/pages.py
+from scraper import client, metrics, procpool, streaming
+from scraper.coalesce import inflight
+from scraper.memo import parse_memo
+from scraper.parsing import extract_links
+
+
+def scrape_links(url, selector, source, base, max_count=10):
+    """Fetch a section page and return its top ``(source, title, link)`` stories.
+
+    In streaming mode (NEWS_STREAMING=1) the page is read incrementally and
+    the connection is closed once enough headlines are found; otherwise the
+    full body goes through the conditional-GET cache and the parse memo.
+    Concurrent calls for the same page share one fetch and one parse.
+    """
+    key = ("links", url, selector, source, base, max_count)
+    return list(inflight.run(key, lambda: _scrape_links(url, selector, source, base, max_count)))
+
+
+def _scrape_links(url, selector, source, base, max_count):
+    if streaming.ENABLED:
+        stories = streaming.stream_links(url, selector, source, base, max_count)
+        if stories is not None:
+            return stories
+
+    html = client.fetch_text(url)
+    with metrics.timed("parse"):
+        return parse_memo.parse(
+            (url, selector, source, base, max_count), html,
+            lambda body: procpool.run(extract_links, body, selector, source, base, max_count),
+        )
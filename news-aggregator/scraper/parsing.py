@@ -0,0 +1,69 @@
+#scraper/parsing.py
+import os
+
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401
+    HAVE_LXML = True
+except ImportError:
+    HAVE_LXML = False
+
+
+def _bs4_matches(html, selector, features):
+    soup = BeautifulSoup(html, features)
+    # soup.css.iselect (bs4 >= 4.12) yields matches lazily, so extraction
+    # stops walking the tree once enough links have been collected.
+    matches = soup.css.iselect(selector) if hasattr(soup, "css") else soup.select(selector)
+    for item in matches:
+        anchor = item if item.name == "a" else item.find_parent("a")
+        yield item.get_text(strip=True), anchor.get("href", "") if anchor else None
+
+
+def _selectolax_matches(html, selector):
+    tree = LexborHTMLParser(html)
+    for node in tree.css(selector):
+        anchor = node
+        while anchor is not None and anchor.tag != "a":
+            anchor = anchor.parent
+        yield node.text(strip=True), (anchor.attributes.get("href") or "") if anchor else None
+
+
+BACKENDS = {"html.parser": lambda html, selector: _bs4_matches(html, selector, "html.parser")}
+if HAVE_LXML:
+    BACKENDS["lxml"] = lambda html, selector: _bs4_matches(html, selector, "lxml")
+if LexborHTMLParser is not None:
+    BACKENDS["selectolax"] = _selectolax_matches
+
+DEFAULT_BACKEND = next(name for name in ("selectolax", "lxml", "html.parser") if name in BACKENDS)
+BACKEND = os.environ.get("NEWS_PARSER", DEFAULT_BACKEND)
+if BACKEND not in BACKENDS:
+    print(f"Parser backend {BACKEND!r} is not available, using {DEFAULT_BACKEND!r}")
+    BACKEND = DEFAULT_BACKEND
+
+
+def extract_links(html, selector, source, base, max_count=10, backend=None):
+    """Return up to ``max_count`` ``(source, title, link)`` tuples from ``html``.
+
+    Each element matching ``selector`` contributes its text as the title
+    and the href of the nearest enclosing ``<a>`` (or itself) as the link.
+    Matching stops as soon as ``max_count`` unique links are found.
+    """
+    stories = []
+    seen = set()
+    for title, href in BACKENDS[backend or BACKEND](html, selector):
+        if not title or href is None:
+            continue
+        link = base + href if href.startswith("/") else href
+        if link in seen:
+            continue
+        seen.add(link)
+        stories.append((source, title, link))
+        if len(stories) >= max_count:
+            break
+    return stories
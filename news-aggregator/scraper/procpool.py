@@ -0,0 +1,48 @@
+#scraper/procpool.py
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+PROCESSES = int(os.environ.get("NEWS_PARSE_PROCESSES", "0"))  # 0 parses in-thread
+MIN_CHARS = 64 * 1024  # smaller pages cost more to ship to a worker than to parse
+
+_pool = None
+_lock = threading.Lock()
+
+
+def _get_pool():
+    global _pool
+    with _lock:
+        if _pool is None:
+            # "spawn" keeps workers independent of the threads (and Qt) of
+            # the parent process.
+            _pool = ProcessPoolExecutor(PROCESSES, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def run(func, html, *args):
+    """Return ``func(html, *args)``, computed in a worker process if worthwhile.
+
+    ``func`` must be a module-level function so it can be pickled. Parsing
+    holds the GIL, so large pages are parsed in the pool (when
+    NEWS_PARSE_PROCESSES is set) and only the story tuples come back;
+    small pages, or a pool that has died, are parsed in the calling thread.
+    """
+    if PROCESSES <= 0 or len(html) < MIN_CHARS:
+        return func(html, *args)
+    try:
+        return _get_pool().submit(func, html, *args).result()
+    except BrokenProcessPool as e:
+        print(f"Parse pool failed, parsing in-thread: {e}")
+        shutdown()
+        return func(html, *args)
+
+
+def shutdown():
+    global _pool
+    with _lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
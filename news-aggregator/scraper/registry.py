@@ -0,0 +1,119 @@
+#scraper/registry.py
+import json
+import os
+from collections import namedtuple
+from pathlib import Path
+from urllib.parse import urlsplit
+
+SOURCES_PATH = Path(os.environ.get("NEWS_SOURCES", Path(__file__).resolve().parent.parent / "sources.json"))
+DEFAULT_MAX_COUNT = 10
+KINDS = ("html", "tldr")
+
+# One section page (kind "html") or TLDR category (kind "tldr"). ``url`` is
+# absolute; for TLDR it is the category root and only names the host.
+# ``feed`` is an optional RSS/Atom URL tried before the section page.
+SourceSpec = namedtuple(
+    "SourceSpec",
+    ["platform", "topic", "kind", "url", "selector", "source", "base", "max_count", "category", "feed"],
+)
+
+
+def host_of(url):
+    return urlsplit(url).hostname or ""
+
+
+class Registry:
+    """Declarative (platform, topic) -> SourceSpec table loaded from JSON.
+
+    The file has a ``platforms`` object of defaults (source label, base URL,
+    selector, max_count, kind) and a ``sources`` list where each entry names
+    its platform and topic and overrides any default; a ``url`` or ``feed``
+    starting with ``/`` is resolved against the platform's base.
+    """
+
+    def __init__(self, platforms, sources):
+        self.platforms = platforms
+        self.sources = {}
+        for entry in sources:
+            spec = self._spec(entry)
+            self.sources[(spec.platform, spec.topic)] = spec
+
+    def _spec(self, entry):
+        try:
+            platform, topic = entry["platform"], entry["topic"]
+        except KeyError as e:
+            raise ValueError(f"Source entry {entry!r} is missing {e}") from None
+        fields = dict(self.platforms.get(platform, {}), **entry)
+        kind = fields.get("kind", "html")
+        if kind not in KINDS:
+            raise ValueError(f"{platform}/{topic}: unknown kind {kind!r}")
+        base = fields.get("base", "").rstrip("/")
+        category = fields.get("category")
+        if kind == "tldr":
+            if not category:
+                raise ValueError(f"{platform}/{topic}: a tldr source needs a category")
+            url = f"{base}/{category}"
+        else:
+            url = fields.get("url", "")
+            if url.startswith("/"):
+                url = base + url
+            if not url or not fields.get("selector"):
+                raise ValueError(f"{platform}/{topic}: an html source needs a url and a selector")
+        feed = entry.get("feed")
+        if feed and kind != "html":
+            raise ValueError(f"{platform}/{topic}: only html sources can have a feed")
+        if feed and feed.startswith("/"):
+            feed = base + feed
+        return SourceSpec(
+            platform, topic, kind, url, fields.get("selector"), fields.get("source", platform),
+            base, int(fields.get("max_count", DEFAULT_MAX_COUNT)), category, feed,
+        )
+
+    def get(self, platform, topic):
+        return self.sources[(platform, topic)]
+
+    def by_platform(self):
+        """``{platform: {topic: spec}}`` in file order."""
+        table = {}
+        for (platform, topic), spec in self.sources.items():
+            table.setdefault(platform, {})[topic] = spec
+        return table
+
+
+def load_registry(path=SOURCES_PATH):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return Registry(data.get("platforms", {}), data.get("sources", []))
+
+
+def scrape(spec):
+    """Generic extraction engine: return the stories of one source."""
+    # A feed that fails or lists nothing falls back to the section page.
+    return (spec.feed and scrape_feed(spec)) or scrape_page(spec)
+
+
+def scrape_feed(spec):
+    """Stories from the source's feed, or [] when it cannot be read."""
+    # Imported here (as below) so that loading the registry stays cheap at startup.
+    from scraper.feeds import scrape_feed
+    try:
+        return scrape_feed(spec.feed, spec.source, spec.max_count)
+    except Exception as e:
+        print(f"Error reading feed {spec.feed}, scraping the page instead: {e}")
+        return []
+
+
+def scrape_page(spec):
+    """Stories from the source's page (or TLDR issue), ignoring any feed."""
+    if spec.kind == "tldr":
+        from scraper.tldr_utils import get_tldr_articles
+        return get_tldr_articles(spec.category, spec.source)
+    from scraper.pages import scrape_links
+    return scrape_links(spec.url, spec.selector, spec.source, spec.base, spec.max_count)
+
+
+def scrape_source(platform, topic):
+    return scrape(REGISTRY.get(platform, topic))
+
+
+REGISTRY = load_registry()
@@ -0,0 +1,183 @@
+#scraper/replay.py
+"""Record the pages every scraper fetches and serve them back offline.
+
+Usage:
+    python -m scraper.replay record fixtures/
+    python -m scraper.replay serve fixtures/ --port 8800 [--latency 50]
+    NEWS_REPLAY=http://127.0.0.1:8800 python main.py
+"""
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+INDEX = "index.json"
+
+
+def to_replay(base, url):
+    """Map ``https://host/path?q`` to ``<base>/https/host/path?q``."""
+    parts = urlsplit(url)
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{base.rstrip('/')}/{parts.scheme}/{parts.netloc}{parts.path or '/'}{query}"
+
+
+def from_replay(base, url):
+    """Inverse of ``to_replay``; other URLs are returned unchanged."""
+    prefix = base.rstrip("/") + "/"
+    if not url.startswith(prefix):
+        return url
+    scheme, _, rest = url[len(prefix):].partition("/")
+    return f"{scheme}://{rest}"
+
+
+class Recorder:
+    """Client observer that keeps every fetched page, grouped by source."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.source = None
+        self.pages = {}
+        self.sources = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, url, res):
+        body = res.content
+        name = hashlib.blake2b(res.url.encode("utf-8"), digest_size=10).hexdigest() + ".html"
+        with self._lock:
+            if res.url != url:
+                self.pages[url] = {"redirect": res.url}
+            self.pages[res.url] = {
+                "file": name,
+                "status": res.status_code,
+                "content_type": res.headers.get("Content-Type", "text/html"),
+            }
+            if self.source is not None:
+                self.sources.setdefault(self.source, []).append(url)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / name).write_bytes(body)
+
+    def save(self):
+        index = {
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            "pages": self.pages,
+            "sources": self.sources,
+        }
+        with open(self.directory / INDEX, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=1)
+
+
+def load_index(directory):
+    with open(Path(directory) / INDEX, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def record(directory, platforms=None):
+    """Run every scraper once against the live sites and save what they fetch."""
+    # A throwaway cache makes every request a full GET (no 304s, no cached
+    # TLDR issues), and streaming is off so whole bodies are captured.
+    os.environ["NEWS_AGGREGATOR_CACHE"] = tempfile.mkdtemp(prefix="news-record-")
+    os.environ["NEWS_STREAMING"] = "0"
+    from fetcher import PLATFORM_TOPIC_MAP, load_scraper
+    from scraper import client
+    from scraper.pages import scrape_links
+
+    recorder = Recorder(directory)
+    client.observers.append(recorder)
+    try:
+        for platform, topics in PLATFORM_TOPIC_MAP.items():
+            if platforms and platform not in platforms:
+                continue
+            for topic in topics:
+                recorder.source = f"{platform}/{topic}"
+                try:
+                    print(f"{recorder.source}: {len(load_scraper(platform, topic)())} stories")
+                    spec = topics[topic]
+                    if spec.feed:
+                        # Keep the section page too, for the HTML fallback.
+                        scrape_links(spec.url, spec.selector, spec.source, spec.base, spec.max_count)
+                except Exception as e:
+                    print(f"Error recording {recorder.source}: {e}")
+    finally:
+        client.observers.remove(recorder)
+    recorder.save()
+    return recorder
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+        url = from_replay(server.url, server.url + self.path)
+        page = server.pages.get(url)
+        if page is None:
+            self.send_error(404, f"not recorded: {url}")
+            return
+        if "redirect" in page:
+            self.send_response(302)
+            self.send_header("Location", to_replay(server.url, page["redirect"]))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = (server.directory / page["file"]).read_bytes()
+        self.send_response(page["status"])
+        self.send_header("Content-Type", page["content_type"])
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """Local stand-in for the news sites, serving a recorded fixture directory."""
+
+    daemon_threads = True
+
+    def __init__(self, directory, host="127.0.0.1", port=0, latency=0.0):
+        super().__init__((host, port), ReplayHandler)
+        self.directory = Path(directory)
+        self.pages = load_index(directory)["pages"]
+        self.latency = latency
+        self.url = f"http://{host}:{self.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record and replay scraper fixtures")
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_cmd = commands.add_parser("record", help="fetch every source once and save the pages")
+    record_cmd.add_argument("directory")
+    record_cmd.add_argument("--platform", action="append", help="only record this platform")
+    serve_cmd = commands.add_parser("serve", help="serve a recorded directory")
+    serve_cmd.add_argument("directory")
+    serve_cmd.add_argument("--host", default="127.0.0.1")
+    serve_cmd.add_argument("--port", type=int, default=8800)
+    serve_cmd.add_argument("--latency", type=float, default=0, metavar="MS", help="delay added to every response")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        recorder = record(args.directory, args.platform)
+        print(f"Recorded {len(recorder.pages)} pages to {args.directory}")
+        return
+    server = ReplayServer(args.directory, args.host, args.port, args.latency / 1000)
+    print(f"Replaying {args.directory} at {server.url} (set NEWS_REPLAY={server.url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#scraper/resilience.py
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+
+RATE = 4.0             # requests per second allowed per host
+BURST = 8              # requests a host may receive back to back
+MAX_RETRIES = 2
+BACKOFF_BASE = 0.5     # seconds; doubles with each retry, fully jittered
+BACKOFF_CAP = 4.0      # longer waits (including Retry-After) are not worth it
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+FAILURE_THRESHOLD = 3  # consecutive failed attempts that open a host's breaker
+COOL_DOWN = 120        # seconds a host is skipped once its breaker opens
+
+
+class HostUnavailable(Exception):
+    """Raised instead of contacting a host whose circuit breaker is open."""
+
+
+class TokenBucket:
+    """Allows ``rate`` acquisitions per second with bursts of up to ``burst``."""
+
+    def __init__(self, rate=RATE, burst=BURST):
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """Stops calls to a host after repeated failures, for ``cool_down`` seconds.
+
+    Once the cool-down has passed a single trial call is let through: if it
+    succeeds the breaker closes again, otherwise it stays open for another
+    cool-down. A trial that never reports back does not hold the breaker
+    open for good; another one is let through after a further cool-down.
+    """
+
+    def __init__(self, threshold=FAILURE_THRESHOLD, cool_down=COOL_DOWN):
+        self.threshold = threshold
+        self.cool_down = cool_down
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at >= self.cool_down:
+                self._trial = True
+                self._opened_at = now
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+                self._trial = False
+
+    @property
+    def is_open(self):
+        with self._lock:
+            return self._opened_at is not None
+
+
+class Host:
+    def __init__(self, name):
+        self.name = name
+        self.bucket = TokenBucket()
+        self.breaker = CircuitBreaker()
+        self.scoped_breakers = {}
+        self._lock = threading.Lock()
+
+    def breaker_for(self, scope=None):
+        """The host's breaker, or a separate one for requests of ``scope``."""
+        if scope is None:
+            return self.breaker
+        with self._lock:
+            breaker = self.scoped_breakers.get(scope)
+            if breaker is None:
+                breaker = self.scoped_breakers[scope] = CircuitBreaker()
+            return breaker
+
+
+_hosts = {}
+_hosts_lock = threading.Lock()
+
+
+def host_for(url):
+    name = urlsplit(url).hostname or ""
+    with _hosts_lock:
+        host = _hosts.get(name)
+        if host is None:
+            host = _hosts[name] = Host(name)
+        return host
+
+
+def _backoff(attempt):
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+
+def _retry_delay(res, attempt):
+    """Seconds to wait before retrying ``res``, or None if it is not worth it."""
+    retry_after = res.headers.get("Retry-After")
+    if not retry_after:
+        return _backoff(attempt)
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return _backoff(attempt)
+    return max(0.0, delay) if delay <= BACKOFF_CAP else None
+
+
+def call(url, send, scope=None):
+    """Run ``send()`` (a request to ``url``) under its host's resilience policy.
+
+    Requests are paced by a per-host token bucket. Connection errors and
+    429/5xx responses are retried up to ``MAX_RETRIES`` times with jittered
+    exponential backoff; read timeouts are not, since they already used up
+    a full timeout. Every failed attempt counts towards the host's circuit
+    breaker, and while it is open ``HostUnavailable`` is raised without
+    contacting the host. The last response is returned even if it failed.
+    Requests given a ``scope`` share the host's rate limit but trip a
+    breaker of their own, so e.g. failing article pages do not stop the
+    section refreshes of the same site.
+    """
+    host = host_for(url)
+    breaker = host.breaker_for(scope)
+    for attempt in range(MAX_RETRIES + 1):
+        if not breaker.allow():
+            raise HostUnavailable(f"{host.name} is cooling down after repeated failures")
+        host.bucket.acquire()
+        try:
+            res = send()
+        except requests.ConnectionError:
+            breaker.record_failure()
+            if attempt == MAX_RETRIES:
+                raise
+            time.sleep(_backoff(attempt))
+            continue
+        except requests.Timeout:
+            breaker.record_failure()
+            raise
+        except Exception:
+            # A body that breaks off, too many redirects and the like are
+            # not retried, but still count (and settle a half-open trial).
+            breaker.record_failure()
+            raise
+
+        if res.status_code not in RETRY_STATUSES:
+            breaker.record_success()
+            return res
+        breaker.record_failure()
+        delay = _retry_delay(res, attempt)
+        if attempt == MAX_RETRIES or delay is None:
+            return res
+        res.close()
+        time.sleep(delay)
@@ -0,0 +1,184 @@
+#scraper/streaming.py
+import codecs
+import os
+import re
+from html.parser import HTMLParser
+
+from scraper import client, metrics
+
+ENABLED = os.environ.get("NEWS_STREAMING", "0") == "1"
+CHUNK_SIZE = 16 * 1024
+MAX_BYTES = 2 * 1024 * 1024
+
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+_COMPOUND = re.compile(r"^(?P<tag>[a-zA-Z][\w-]*|\*)?(?P<rest>(?:[.#][\w-]+)*)$")
+
+
+def parse_selector(selector):
+    """Compile a selector list made of descendant chains of tag/.class/#id parts.
+
+    Returns a list of chains, each a list of ``(tag, id, classes)`` tuples,
+    or None when the selector uses anything the streaming matcher does not
+    understand (child/sibling combinators, attributes, pseudo-classes).
+    """
+    chains = []
+    for group in selector.split(","):
+        parts = group.split()
+        if not parts:
+            return None
+        chain = []
+        for part in parts:
+            match = _COMPOUND.match(part)
+            if not match:
+                return None
+            tag = match.group("tag")
+            rest = re.findall(r"[.#][\w-]+", match.group("rest"))
+            ids = [r[1:] for r in rest if r[0] == "#"]
+            if len(ids) > 1:
+                return None
+            classes = frozenset(r[1:] for r in rest if r[0] == ".")
+            chain.append((None if tag in (None, "*") else tag.lower(), ids[0] if ids else None, classes))
+        chains.append(chain)
+    return chains
+
+
+def _matches(compound, element):
+    tag, element_id, classes = compound
+    return ((tag is None or tag == element["tag"])
+            and (element_id is None or element_id == element["id"])
+            and classes <= element["classes"])
+
+
+class HeadlineStream(HTMLParser):
+    """Incremental selector matcher fed with chunks of a document.
+
+    Each element matching the selector is captured with its stripped text
+    and the href of the nearest enclosing ``<a>``; completed captures are
+    handed out in document order by ``pop_ready``.
+    """
+
+    def __init__(self, chains):
+        super().__init__(convert_charrefs=True)
+        self.chains = chains
+        self.stack = []
+        self.captures = []
+
+    def _selected(self, element):
+        for chain in self.chains:
+            if not _matches(chain[-1], element):
+                continue
+            remaining = len(chain) - 2
+            for ancestor in reversed(self.stack):
+                if remaining < 0:
+                    break
+                if _matches(chain[remaining], ancestor):
+                    remaining -= 1
+            if remaining < 0:
+                return True
+        return False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        element = {
+            "tag": tag,
+            "id": attrs.get("id"),
+            "classes": frozenset((attrs.get("class") or "").split()),
+            "href": attrs.get("href") or "",
+            "capture": None,
+        }
+        if self._selected(element):
+            anchor = element if tag == "a" else next((e for e in reversed(self.stack) if e["tag"] == "a"), None)
+            capture = {"text": [], "href": anchor["href"] if anchor else None, "done": False}
+            element["capture"] = capture
+            self.captures.append(capture)
+        if tag in VOID_TAGS:
+            if element["capture"]:
+                element["capture"]["done"] = True
+            return
+        self.stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i]["tag"] == tag:
+                for element in self.stack[i:]:
+                    if element["capture"]:
+                        element["capture"]["done"] = True
+                del self.stack[i:]
+                return
+
+    def handle_data(self, data):
+        if self.stack and self.stack[-1]["tag"] in ("script", "style"):
+            return
+        text = data.strip()
+        if not text:
+            return
+        for element in self.stack:
+            if element["capture"]:
+                element["capture"]["text"].append(text)
+
+    def pop_ready(self, flush=False):
+        ready = []
+        while self.captures and (flush or self.captures[0]["done"]):
+            capture = self.captures.pop(0)
+            ready.append(("".join(capture["text"]), capture["href"]))
+        return ready
+
+
+def stream_links(url, selector, source, base, max_count=10, max_bytes=MAX_BYTES):
+    """Stream ``url`` and stop reading once ``max_count`` unique links are found.
+
+    Returns None when ``selector`` is too complex for the streaming matcher,
+    so the caller can fall back to a full download and parse. At most
+    ``max_bytes`` of the (decompressed) body are read.
+    """
+    chains = parse_selector(selector)
+    if chains is None:
+        return None
+
+    stories = []
+    seen = set()
+
+    def collect(matches):
+        for title, href in matches:
+            if not title or href is None:
+                continue
+            link = base + href if href.startswith("/") else href
+            if link not in seen:
+                seen.add(link)
+                stories.append((source, title, link))
+            if len(stories) >= max_count:
+                return True
+        return False
+
+    parser = HeadlineStream(chains)
+    # Reading and matching are interleaved, so both count as download time.
+    with client.stream(url) as res, metrics.timed("download"):
+        res.raise_for_status()
+        try:
+            decoder = codecs.getincrementaldecoder(res.encoding or "utf-8")(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        received = 0
+        try:
+            for chunk in res.iter_content(CHUNK_SIZE):
+                received += len(chunk)
+                parser.feed(decoder.decode(chunk))
+                if collect(parser.pop_ready()):
+                    return stories
+                if received >= max_bytes:
+                    break
+        finally:
+            if metrics.current() is not None:
+                metrics.current().add_bytes(received)
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    collect(parser.pop_ready(flush=True))
+    return stories
@@ -1,7 +1,157 @@
 #scraper/tldr_utils.py
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+from bs4 import BeautifulSoup
+
+from scraper import client, metrics, procpool
+from scraper.cache import CACHE_DIR
+from scraper.coalesce import inflight
+
+BASE_URL = "https://tldr.tech"
+ISSUE_CACHE_PATH = CACHE_DIR / "tldr_issues.json"
+ISSUE_CACHE_DAYS = 7    # cached issues older than this are pruned
+DAYS_TO_PROBE = 2       # today and yesterday
+
 
 def fix_tldr_link(href: str) -> str:
    
     if href.startswith("http"):
         return href
     return "https://tldr.tech" + href
+
+
+def parse_issue(html, source, features="html.parser"):
+    soup = BeautifulSoup(html, features)
+    articles = []
+    for section in soup.select("section")[1:]:
+        for a_tag in section.select("article a"):
+            title = a_tag.get_text(strip=True)
+            href = a_tag.get("href", "")
+            if title and href:
+                articles.append((source, title, fix_tldr_link(href)))
+    return articles
+
+
+class IssueCache:
+    """Persistent ``(category, date) -> articles`` map of published TLDR issues.
+
+    An issue for a past date never changes, and neither does the absence of
+    one, so both are kept; ``None`` is returned for dates not yet known.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, encoding="utf-8") as f:
+                self._issues = json.load(f)
+        except (OSError, ValueError):
+            self._issues = {}
+
+    def get(self, category, date):
+        with self._lock:
+            articles = self._issues.get(f"{category}/{date}")
+        return None if articles is None else [tuple(a) for a in articles]
+
+    def put_many(self, issues):
+        cutoff = (datetime.now() - timedelta(days=ISSUE_CACHE_DAYS)).strftime("%Y-%m-%d")
+        with self._lock:
+            for (category, date), articles in issues.items():
+                self._issues[f"{category}/{date}"] = [list(a) for a in articles]
+            self._issues = {k: v for k, v in self._issues.items() if k.rsplit("/", 1)[1] >= cutoff}
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(self._issues, f)
+                os.replace(tmp, self.path)
+            except OSError as e:
+                print(f"Error saving TLDR issue cache: {e}")
+
+
+issue_cache = IssueCache(ISSUE_CACHE_PATH)
+
+
+def _probe(category, source, date):
+    """Return the issue's articles, or None if TLDR redirected (no issue that day)."""
+    url = f"{BASE_URL}/{category}/{date}"
+
+    def probe():
+        res = client.get(url)
+        res.raise_for_status()
+        if res.url.rstrip("/") != url.rstrip("/"):
+            return None
+        with metrics.timed("parse"):
+            return procpool.run(parse_issue, res.text, source)
+
+    return inflight.run(("issue", url, source), probe)
+
+
+def _issue_dates():
+    return [(datetime.now() - timedelta(days=offset)).strftime("%Y-%m-%d") for offset in range(DAYS_TO_PROBE)]
+
+
+class IssueProbe:
+    """The newest issue of one category, assembled from one probe per date.
+
+    Dates already in the issue cache are never requested again; the rest
+    are listed in ``pending`` and may be probed concurrently (the fetcher
+    runs each as its own tldr.tech unit). Once every pending date has been
+    probed, ``result`` returns the newest published issue and caches the
+    answers that are final.
+    """
+
+    def __init__(self, category, source):
+        self.category = category
+        self.source = source
+        self.dates = _issue_dates()
+        self.found = {date: issue_cache.get(category, date) for date in self.dates}
+        self.pending = [date for date in self.dates if self.found[date] is None]
+        self.error = None
+        self._probed = False
+        self._published = {}
+        self._lock = threading.Lock()
+
+    def probe(self, date):
+        """Probe one pending date; return True if it was the last one."""
+        try:
+            articles = _probe(self.category, self.source, date)
+        except Exception as e:
+            print(f"Error fetching {BASE_URL}/{self.category}/{date}: {e}")
+            articles = None
+            with self._lock:
+                self.error = e
+        else:
+            with self._lock:
+                self._probed = True
+                # Today's issue may not be out yet; anything else is final.
+                if articles or date != self.dates[0]:
+                    self._published[(self.category, date)] = articles or []
+        with self._lock:
+            self.found[date] = articles
+            self.pending.remove(date)
+            last = not self.pending
+        if last and self._published:
+            issue_cache.put_many(self._published)
+        return last
+
+    def result(self):
+        """The newest published issue. If nothing could be probed and no
+        older issue is cached, the last probe error is raised so the source
+        counts as failed rather than empty."""
+        articles = next((self.found[date] for date in self.dates if self.found[date]), None)
+        if articles:
+            return articles
+        if self.error is not None and not self._probed:
+            raise self.error
+        return []
+
+
+def get_tldr_articles(category, source):
+    issue = IssueProbe(category, source)
+    for date in list(issue.pending):
+        issue.probe(date)
+    return issue.result()
@@ -0,0 +1,96 @@
+import bisect
+import heapq
+import math
+import re
+import threading
+
+from clustering import STOPWORDS
+
+K1 = 1.2
+B = 0.75
+MAX_PREFIX_TERMS = 20   # vocabulary terms a trailing partial word may expand to
+COMMON_TERM_DOCS = 2000 # posting lists longer than this only re-score matches
+
+
+def tokenize(text):
+    return [w for w in re.findall(r"[a-z0-9]+", text.lower()) if w not in STOPWORDS]
+
+
+class HeadlineIndex:
+    """Incrementally maintained inverted index over headlines, ranked with BM25.
+
+    Headlines are tokenized once, when added; a query only walks the posting
+    lists of its own terms. A last query term that is not a known word is
+    matched as a prefix, so results update while a word is being typed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings = {}
+        self._vocabulary = []
+        self._docs = {}
+        self._lengths = {}
+        self._total_length = 0
+
+    def add(self, doc_id, title, story):
+        """Index ``title`` under ``doc_id``; ``story`` is returned by searches."""
+        terms = tokenize(title)
+        with self._lock:
+            if doc_id in self._docs:
+                return False
+            self._docs[doc_id] = story
+            self._lengths[doc_id] = len(terms)
+            self._total_length += len(terms)
+            counts = {}
+            for term in terms:
+                counts[term] = counts.get(term, 0) + 1
+            for term, tf in counts.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    bisect.insort(self._vocabulary, term)
+                postings[doc_id] = tf
+            return True
+
+    def __len__(self):
+        with self._lock:
+            return len(self._docs)
+
+    def _expand_prefix(self, prefix):
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        terms = []
+        for term in self._vocabulary[start:start + MAX_PREFIX_TERMS]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, query, limit=100):
+        """Return up to ``limit`` stories best matching ``query``, best first."""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        with self._lock:
+            if not self._docs:
+                return []
+            if terms[-1] not in self._postings and not query[-1:].isspace():
+                terms = terms[:-1] + self._expand_prefix(terms[-1])
+
+            n = len(self._docs)
+            length_weight = B / (self._total_length / n or 1)
+            lengths = self._lengths
+            scores = {}
+            posting_lists = sorted((self._postings[t] for t in set(terms) if t in self._postings), key=len)
+            for postings in posting_lists:
+                idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+                # Rarest terms go first; a very common term only re-scores the
+                # documents already matched (its idf is small anyway).
+                if scores and len(postings) > max(COMMON_TERM_DOCS, len(scores)):
+                    matches = [(doc_id, postings[doc_id]) for doc_id in scores if doc_id in postings]
+                else:
+                    matches = postings.items()
+                for doc_id, tf in matches:
+                    norm = K1 * (1 - B + length_weight * lengths[doc_id])
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+            best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            return [self._docs[doc_id] for doc_id, _ in best]
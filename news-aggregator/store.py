@@ -0,0 +1,99 @@
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from scraper.cache import CACHE_DIR
+
+DB_PATH = CACHE_DIR / "stories.db"
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "cmpid", "mc_cid", "mc_eid")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS stories (
+    id INTEGER PRIMARY KEY,
+    url_key TEXT NOT NULL UNIQUE,
+    link TEXT NOT NULL,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    platform TEXT,
+    topic TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS stories_first_seen ON stories (first_seen);
+CREATE INDEX IF NOT EXISTS stories_last_seen ON stories (last_seen);
+"""
+
+UPSERT = """
+INSERT INTO stories (url_key, link, source, title, platform, topic, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (url_key) DO UPDATE SET
+    title = excluded.title,
+    link = excluded.link,
+    last_seen = excluded.last_seen
+"""
+
+
+def normalize_url(link):
+    """Canonical form of a story URL used as its identity in the store.
+
+    Scheme and host are lower-cased, fragments and tracking parameters are
+    dropped, the remaining query is sorted and a trailing slash is removed.
+    """
+    parts = urlsplit(link.strip())
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if not k.lower().startswith(TRACKING_PARAMS))
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+class StoryStore:
+    """SQLite-backed history of every story the scrapers have returned."""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        if path != ":memory:":
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def upsert(self, results, now=None):
+        """Record one refresh's ``{(platform, topic): stories}`` in a single transaction."""
+        now = time.time() if now is None else now
+        rows = [
+            (normalize_url(link), link, source, title, platform, topic, now, now)
+            for (platform, topic), stories in results.items()
+            for source, title, link in stories
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(UPSERT, rows)
+        return len(rows)
+
+    def new_since(self, since, platforms=None, topics=None, limit=None):
+        """Stories first seen after ``since``, newest first (served by the first_seen index)."""
+        return self._query("first_seen > ?", [since], platforms, topics, "first_seen DESC", limit)
+
+    def latest(self, limit=500, platforms=None, topics=None):
+        return self._query("1", [], platforms, topics, "last_seen DESC, id", limit)
+
+    def _query(self, where, params, platforms, topics, order, limit):
+        if platforms:
+            where += f" AND platform IN ({','.join('?' * len(platforms))})"
+            params = params + list(platforms)
+        if topics:
+            where += f" AND topic IN ({','.join('?' * len(topics))})"
+            params = params + list(topics)
+        sql = f"SELECT * FROM stories WHERE {where} ORDER BY {order}"
+        if limit:
+            sql += " LIMIT ?"
+            params = params + [limit]
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
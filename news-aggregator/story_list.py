@@ -0,0 +1,168 @@
+from PyQt5.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QSize, Qt
+from PyQt5.QtGui import QFont, QFontMetrics, QPalette
+
+from clustering import TitleClusterer
+
+SourceRole = Qt.UserRole
+TitleRole = Qt.UserRole + 1
+LinkRole = Qt.UserRole + 2
+AlternatesRole = Qt.UserRole + 3
+
+
+class StoryModel(QAbstractListModel):
+    """List model with one row per cluster of near-duplicate stories.
+
+    Each row holds the ``(source, title, link)`` stories of one cluster; the
+    first is shown and the rest (usually other outlets running the same
+    story) are exposed as alternates. Refreshes are applied as diffs:
+    ``add_stories`` inserts rows for new clusters or extends existing ones,
+    and ``retain`` removes what a refresh no longer returned, so the view
+    keeps its scroll position and selection.
+    """
+
+    def __init__(self, parent=None, clusterer=None):
+        super().__init__(parent)
+        self.clusterer = clusterer if clusterer is not None else TitleClusterer()
+        self._rows = []
+        self._cluster_rows = {}
+        self._links = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        source, title, link = row[0]
+        if role == Qt.DisplayRole:
+            return f"[{source}] {title}"
+        if role == Qt.ToolTipRole:
+            lines = [title, link]
+            lines += [f"Also: [{s}] {t}" for s, t, _ in row[1:]]
+            return "\n".join(lines)
+        if role == SourceRole:
+            return source
+        if role == TitleRole:
+            return title
+        if role == LinkRole:
+            return link
+        if role == AlternatesRole:
+            return list(row[1:])
+        return None
+
+    def stories(self):
+        return [row[0] for row in self._rows]
+
+    def cluster(self, row):
+        return list(self._rows[row])
+
+    def _row_index(self, row):
+        return next(i for i, r in enumerate(self._rows) if r is row)
+
+    def add_stories(self, stories):
+        new_rows = []
+        changed = []
+        for story in stories:
+            source, title, link = story
+            if link in self._links:
+                continue
+            cluster_id = self.clusterer.add(link, title)
+            self._links[link] = cluster_id
+            row = self._cluster_rows.get(cluster_id)
+            if row is None:
+                row = self._cluster_rows[cluster_id] = [story]
+                new_rows.append(row)
+            else:
+                row.append(story)
+                if not any(row is r for r in new_rows + changed):
+                    changed.append(row)
+
+        for row in changed:
+            index = self.index(self._row_index(row))
+            self.dataChanged.emit(index, index)
+        if new_rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+            self._rows.extend(new_rows)
+            self.endInsertRows()
+
+    def retain(self, links):
+        """Drop stories whose link is not in ``links`` and the rows left empty."""
+        i = len(self._rows) - 1
+        while i >= 0:
+            row = self._rows[i]
+            kept = [story for story in row if story[2] in links]
+            if kept:
+                if len(kept) != len(row):
+                    for story in row:
+                        if story[2] not in links:
+                            del self._links[story[2]]
+                    row[:] = kept
+                    index = self.index(i)
+                    self.dataChanged.emit(index, index)
+                i -= 1
+                continue
+            last = i
+            while i >= 0 and not any(story[2] in links for story in self._rows[i]):
+                i -= 1
+            self.beginRemoveRows(QModelIndex(), i + 1, last)
+            for row in self._rows[i + 1:last + 1]:
+                for story in row:
+                    self._cluster_rows.pop(self._links.pop(story[2]), None)
+            del self._rows[i + 1:last + 1]
+            self.endRemoveRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._cluster_rows = {}
+        self._links = {}
+        self.endResetModel()
+
+
+class StoryDelegate(QStyledItemDelegate):
+    """Paints one cluster per fixed-height row: a bold source tag, an elided
+    title and, when other outlets ran the same story, a count of alternates."""
+
+    PADDING = 4
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        selected = opt.state & QStyle.State_Selected
+        rect = opt.rect.adjusted(self.PADDING, 0, -self.PADDING, 0)
+        tag = f"[{index.data(SourceRole)}] "
+
+        painter.save()
+        bold = QFont(opt.font)
+        bold.setBold(True)
+        painter.setFont(bold)
+        painter.setPen(opt.palette.color(QPalette.HighlightedText if selected else QPalette.Text))
+        painter.drawText(rect, Qt.AlignVCenter | Qt.AlignLeft, tag)
+        rect.setLeft(rect.left() + QFontMetrics(bold).horizontalAdvance(tag))
+
+        painter.setFont(opt.font)
+        metrics = QFontMetrics(opt.font)
+        alternates = index.data(AlternatesRole)
+        if alternates:
+            outlets = ", ".join(sorted({source for source, _, _ in alternates}))
+            suffix = f"  +{len(alternates)} {outlets}"
+            if not selected:
+                painter.setPen(opt.palette.color(QPalette.PlaceholderText))
+            painter.drawText(rect, Qt.AlignVCenter | Qt.AlignRight, suffix)
+            rect.setRight(rect.right() - metrics.horizontalAdvance(suffix))
+
+        if not selected:
+            painter.setPen(opt.palette.color(QPalette.Link))
+        title = metrics.elidedText(index.data(TitleRole), Qt.ElideRight, rect.width())
+        painter.drawText(rect, Qt.AlignVCenter | Qt.AlignLeft, title)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(0, QFontMetrics(option.font).height() + 2 * self.PADDING)
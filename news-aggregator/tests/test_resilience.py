@@ -0,0 +1,61 @@
+import sys
+import time
+import unittest
+from pathlib import Path
+
+import requests
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from scraper.resilience import CircuitBreaker, HostUnavailable, call, host_for
+
+
+class Response:
+    status_code = 200
+    headers = {}
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def setUp(self):
+        self.url = f"https://{self.id()}.test/page"
+        host_for(self.url).breaker = CircuitBreaker(threshold=1, cool_down=0.05)
+
+    def trip(self):
+        def timeout():
+            raise requests.Timeout("slow")
+        with self.assertRaises(requests.Timeout):
+            call(self.url, timeout)
+        with self.assertRaises(HostUnavailable):
+            call(self.url, Response)
+        time.sleep(0.06)
+
+    def test_trial_success_closes(self):
+        self.trip()
+        self.assertEqual(call(self.url, Response).status_code, 200)
+        self.assertFalse(host_for(self.url).breaker.is_open)
+
+    def test_trial_with_unexpected_error_settles(self):
+        self.trip()
+
+        def broken_body():
+            raise requests.exceptions.ChunkedEncodingError("connection broken")
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            call(self.url, broken_body)
+        # The failed trial reopens the breaker for one more cool-down only.
+        with self.assertRaises(HostUnavailable):
+            call(self.url, Response)
+        time.sleep(0.06)
+        self.assertEqual(call(self.url, Response).status_code, 200)
+
+    def test_unreported_trial_expires(self):
+        breaker = CircuitBreaker(threshold=1, cool_down=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        time.sleep(0.06)
+        self.assertTrue(breaker.allow())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import threading
+import time
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire ``ttl`` seconds after being set."""
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def set(self, key, value, ttl=None):
+        now = time.time()
+        with self._lock:
+            self._entries[key] = (now + (self.ttl if ttl is None else ttl), now, value)
+
+    def get(self, key, default=None):
+        entry = self.get_entry(key)
+        return default if entry is None else entry[1]
+
+    def get_entry(self, key):
+        """Return ``(stored_at, value)`` for a live entry, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            return entry[1], entry[2]
+
+    def purge(self):
+        now = time.time()
+        with self._lock:
+            for key in [k for k, (expires, _, _) in self._entries.items() if expires <= now]:
+                del self._entries[key]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)